@@ -25,8 +25,10 @@ pub fn get_localized_demo_items(locale: &str) -> Option<&'static [DemoItem]> {
 }
 
 // Lazy-loaded CSV data structure
-// Maps (locale, filename) -> keywords
-static IMAGE_KEYWORDS: Lazy<HashMap<(String, String), String>> = Lazy::new(|| {
+// Maps locale -> filename -> keywords, so lookups can borrow their keys
+type ImageKeywords = HashMap<String, HashMap<String, String>>;
+
+static IMAGE_KEYWORDS: Lazy<ImageKeywords> = Lazy::new(|| {
     load_image_keywords().unwrap_or_else(|e| {
         eprintln!("Warning: Failed to load image keywords CSV: {}", e);
         HashMap::new()
@@ -34,7 +36,7 @@ static IMAGE_KEYWORDS: Lazy<HashMap<(String, String), String>> = Lazy::new(|| {
 });
 
 /// Load image keywords from CSV file
-fn load_image_keywords() -> Result<HashMap<(String, String), String>, Box<dyn std::error::Error>> {
+fn load_image_keywords() -> Result<ImageKeywords, Box<dyn std::error::Error>> {
     let csv_path = std::path::Path::new(env!("CARGO_MANIFEST_DIR"))
         .parent()
         .ok_or("Failed to get parent directory")?
@@ -42,32 +44,29 @@ fn load_image_keywords() -> Result<HashMap<(String, String), String>, Box<dyn st
     // CSV lives at distribution/image_keywords.csv (sibling of demo-data/)
 
     let mut reader = csv::Reader::from_path(csv_path)?;
-    let mut map = HashMap::new();
 
-    // Get header to map locale names to column indices
+    // One filename -> keywords map per column; column 0 is 'filename'
     let headers = reader.headers()?.clone();
-    let locale_indices: HashMap<&str, usize> = headers
-        .iter()
-        .enumerate()
-        .skip(1) // Skip 'filename' column
-        .map(|(idx, name)| (name, idx))
-        .collect();
+    let mut columns: Vec<HashMap<String, String>> = vec![HashMap::new(); headers.len()];
 
     for result in reader.records() {
         let record: csv::StringRecord = result?;
-        let filename = record.get(0).ok_or("Missing filename column")?.to_string();
+        let filename = record.get(0).ok_or("Missing filename column")?;
 
         // Store keywords for each locale
-        for (locale, &col_idx) in &locale_indices {
-            if let Some(keywords) = record.get(col_idx) {
-                if !keywords.is_empty() {
-                    map.insert((locale.to_string(), filename.clone()), keywords.to_string());
-                }
+        for (keywords, column) in record.iter().zip(columns.iter_mut()).skip(1) {
+            if !keywords.is_empty() {
+                column.insert(filename.to_string(), keywords.to_string());
             }
         }
     }
 
-    Ok(map)
+    Ok(headers
+        .iter()
+        .zip(columns)
+        .skip(1)
+        .map(|(locale, column)| (locale.to_string(), column))
+        .collect())
 }
 
 /// Get localized image keywords for a specific image and locale.
@@ -75,13 +74,9 @@ fn load_image_keywords() -> Result<HashMap<(String, String), String>, Box<dyn st
 /// The keywords are used as the image description in the database.
 pub fn get_localized_image_keywords(locale: &str, filename: &str) -> Option<&'static str> {
     IMAGE_KEYWORDS
-        .get(&(locale.to_string(), filename.to_string()))
-        .map(|s| {
-            // SAFETY: We're returning a reference to a string in a static HashMap
-            // that lives for the entire program lifetime, so this is safe.
-            let ptr = s.as_str() as *const str;
-            unsafe { &*ptr }
-        })
+        .get(locale)?
+        .get(filename)
+        .map(String::as_str)
 }
 
 // ============================================================================
@@ -13,6 +13,7 @@ use futures::StreamExt;
 use image::GenericImageView;
 use indicatif::{ProgressBar, ProgressStyle};
 use purr::content_detection::parse_color_to_rgba;
+use purr::models::StoredItem;
 use purr::{ClipboardStore, ClipboardStoreApi};
 use rand::prelude::*;
 use rand::rngs::StdRng;
@@ -20,10 +21,9 @@ use rusqlite::params;
 use schemars::JsonSchema;
 use serde::{Deserialize, Serialize};
 use serde_json::json;
-use std::collections::hash_map::DefaultHasher;
+use std::collections::{HashMap, HashSet};
 use std::fs;
-use std::hash::{Hash, Hasher};
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 use std::sync::atomic::{AtomicUsize, Ordering};
 use std::sync::Arc;
 use tokio::sync::Semaphore;
@@ -165,19 +165,38 @@ fn compress_to_heic(
     Some(data)
 }
 
-/// Check if an image with the given description and locale already exists
-fn image_exists(db_path: &str, description: &str, locale: &str) -> bool {
-    let conn = match rusqlite::Connection::open(db_path) {
-        Ok(c) => c,
-        Err(_) => return false,
-    };
+/// HEIC-compressed image bytes and thumbnail, keyed by source path.
+/// `None` records a source file that could not be read.
+type PreparedImages = HashMap<PathBuf, Option<(Vec<u8>, Option<Vec<u8>>)>>;
+
+/// Compress `image_path` and build its thumbnail on first use, then serve the
+/// cached result so a source image shared by every locale only runs through
+/// `sips` once.
+fn prepared_image<'a>(
+    cache: &'a mut PreparedImages,
+    image_path: &Path,
+) -> Option<&'a (Vec<u8>, Option<Vec<u8>>)> {
+    cache
+        .entry(image_path.to_path_buf())
+        .or_insert_with(|| {
+            let raw_data = fs::read(image_path).ok()?;
+            let thumbnail = generate_thumbnail(&raw_data, 64);
+            let image_data = compress_to_heic(image_path, 1500, 60).unwrap_or(raw_data);
+            Some((image_data, thumbnail))
+        })
+        .as_ref()
+}
 
-    conn.query_row(
-        "SELECT 1 FROM image_items WHERE description = ?1 AND locale = ?2 LIMIT 1",
-        params![description, locale],
-        |_| Ok(()),
-    )
-    .is_ok()
+/// Load every (description, locale) pair already present in image_items
+fn existing_images(db_path: &str) -> Result<HashSet<(String, String)>> {
+    let conn = rusqlite::Connection::open(db_path)?;
+    let mut stmt = conn.prepare(
+        "SELECT description, locale FROM image_items WHERE description IS NOT NULL AND locale IS NOT NULL",
+    )?;
+    let pairs = stmt
+        .query_map([], |row| Ok((row.get(0)?, row.get(1)?)))?
+        .collect::<Result<HashSet<_>, _>>()?;
+    Ok(pairs)
 }
 
 /// Ensure the locale column exists in the image_items table.
@@ -230,9 +249,7 @@ fn save_image_direct(
     let timestamp_str = now.format("%Y-%m-%d %H:%M:%S%.f").to_string();
 
     let hash_input = format!("{}{}{}", description, image_data.len(), locale);
-    let mut hasher = DefaultHasher::new();
-    hash_input.hash(&mut hasher);
-    let content_hash = hasher.finish().to_string();
+    let content_hash = StoredItem::hash_string(&hash_input);
     let thumbnail = thumbnail.or_else(|| generate_thumbnail(&image_data, 64));
 
     let item_uuid = uuid::Uuid::new_v4().to_string();
@@ -502,9 +519,7 @@ fn delete_english_demo_items(db_path: &str) -> Result<()> {
 
     // Delete items matching English demo content by exact hash
     for item in DEMO_ITEMS {
-        let mut hasher = DefaultHasher::new();
-        item.content.hash(&mut hasher);
-        let content_hash = hasher.finish().to_string();
+        let content_hash = StoredItem::hash_string(item.content);
 
         // Get the item ID first
         let item_id: Option<i64> = conn
@@ -577,9 +592,7 @@ fn insert_demo_items(store: &ClipboardStore, db_path: &str, locale: Option<&str>
                     Some(item.bundle_id.to_string()),
                 );
                 // Always set the correct timestamp (handles both new and duplicate items)
-                let mut hasher = DefaultHasher::new();
-                item.content.hash(&mut hasher);
-                let content_hash = hasher.finish().to_string();
+                let content_hash = StoredItem::hash_string(item.content);
                 if let Some(id) = find_id_by_hash(db_path, &content_hash) {
                     let _ = set_timestamp_direct(db_path, id, now + item.offset);
                 }
@@ -590,6 +603,11 @@ fn insert_demo_items(store: &ClipboardStore, db_path: &str, locale: Option<&str>
             let source_images_dir = base_path.join("../source-images");
             let kitty_path = base_path.join("../../marketing/assets/kitty.jpg");
 
+            // Loaded once instead of querying before every image insert.
+            let mut existing = existing_images(db_path)?;
+            // Every locale reuses the same source files, so compress each once.
+            let mut prepared_images = PreparedImages::new();
+
             // All supported locales (including English)
             let all_locales = [
                 "en", "es", "zh-Hans", "zh-Hant", "ja", "ko", "fr", "de", "pt-BR", "ru",
@@ -601,15 +619,14 @@ fn insert_demo_items(store: &ClipboardStore, db_path: &str, locale: Option<&str>
                     .unwrap_or("cat, kitten, tabby, pet, animal, fur, whiskers");
 
                 // Skip if this image+locale combination already exists
-                if !image_exists(db_path, kitty_keywords, locale_code) {
-                    if let Ok(raw_data) = fs::read(&kitty_path) {
-                        let thumbnail = generate_thumbnail(&raw_data, 64);
-                        let image_data =
-                            compress_to_heic(&kitty_path, 1500, 60).unwrap_or(raw_data);
+                if existing.insert((kitty_keywords.to_string(), locale_code.to_string())) {
+                    if let Some((image_data, thumbnail)) =
+                        prepared_image(&mut prepared_images, &kitty_path)
+                    {
                         if let Ok(id) = save_image_direct(
                             db_path,
-                            image_data,
-                            thumbnail,
+                            image_data.clone(),
+                            thumbnail.clone(),
                             kitty_keywords.to_string(),
                             Some("Photos".to_string()),
                             Some("com.apple.Photos".to_string()),
@@ -631,7 +648,7 @@ fn insert_demo_items(store: &ClipboardStore, db_path: &str, locale: Option<&str>
                         .unwrap_or(*default_keywords);
 
                     // Skip if this image+locale combination already exists
-                    if image_exists(db_path, keywords, locale_code) {
+                    if !existing.insert((keywords.to_string(), locale_code.to_string())) {
                         continue;
                     }
 
@@ -642,14 +659,13 @@ fn insert_demo_items(store: &ClipboardStore, db_path: &str, locale: Option<&str>
                         filename.to_string()
                     };
                     let image_path = source_images_dir.join(&resolved_filename);
-                    if let Ok(raw_data) = fs::read(&image_path) {
-                        let thumbnail = generate_thumbnail(&raw_data, 64);
-                        let image_data =
-                            compress_to_heic(&image_path, 1500, 60).unwrap_or(raw_data);
+                    if let Some((image_data, thumbnail)) =
+                        prepared_image(&mut prepared_images, &image_path)
+                    {
                         if let Ok(id) = save_image_direct(
                             db_path,
-                            image_data,
-                            thumbnail,
+                            image_data.clone(),
+                            thumbnail.clone(),
                             keywords.to_string(),
                             Some(source_app.to_string()),
                             Some(bundle_id.to_string()),
@@ -680,9 +696,7 @@ fn insert_demo_items(store: &ClipboardStore, db_path: &str, locale: Option<&str>
                     Some(item.bundle_id.to_string()),
                 );
                 // Always set the correct timestamp (handles both new and duplicate items)
-                let mut hasher = DefaultHasher::new();
-                item.content.hash(&mut hasher);
-                let content_hash = hasher.finish().to_string();
+                let content_hash = StoredItem::hash_string(item.content);
                 if let Some(id) = find_id_by_hash(db_path, &content_hash) {
                     let _ = set_timestamp_direct(db_path, id, now + item.offset);
                 }
@@ -727,9 +741,7 @@ fn insert_video_items(store: &ClipboardStore, db_path: &str, locale: Option<&str
             Some(item.source_app.to_string()),
             Some(item.bundle_id.to_string()),
         );
-        let mut hasher = DefaultHasher::new();
-        item.content.hash(&mut hasher);
-        let content_hash = hasher.finish().to_string();
+        let content_hash = StoredItem::hash_string(item.content);
         if let Some(id) = find_id_by_hash(db_path, &content_hash) {
             let _ = set_timestamp_direct(db_path, id, now + item.offset);
         }
@@ -898,12 +910,14 @@ async fn main() -> Result<()> {
 
                 match call_gemini(&key, &prompt).await {
                     Ok(items) => {
+                        // The app candidates depend only on the category, so
+                        // filter them once per batch rather than per item.
+                        let valid_apps: Vec<_> = tax
+                            .apps
+                            .iter()
+                            .filter(|a| category.apps.contains(&a.name))
+                            .collect();
                         for content in items {
-                            let valid_apps: Vec<_> = tax
-                                .apps
-                                .iter()
-                                .filter(|a| category.apps.contains(&a.name))
-                                .collect();
                             let app = pick_weighted(&valid_apps, |a| a.weight);
                             if let Ok(id) = st.save_text(
                                 content,
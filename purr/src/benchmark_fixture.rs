@@ -3,12 +3,20 @@ use crate::interface::FilePreviewSnapshot;
 use crate::models::StoredItem;
 use crate::ClipboardStore;
 use anyhow::Result;
+use once_cell::sync::Lazy;
 use rand::rngs::StdRng;
 use rand::{Rng, SeedableRng};
 use std::fs;
 use std::path::{Path, PathBuf};
 
+/// Version of the generated fixture data. Bump it whenever a change alters
+/// the rows the generator produces, so a DB built by an older generator is
+/// rebuilt instead of silently reused and benchmark runs stay comparable.
+/// It is stamped into the DB's `user_version` once the fixture and its index
+/// are complete.
+const FIXTURE_VERSION: i32 = 3;
 const FIXTURE_SEED: u64 = 0xC11C_1771_0000_0001;
+const FILLER_SEED: u64 = 0xC11C_1771_0000_0002;
 const TOTAL_TEXT_ITEMS: usize = 1_094;
 const TOTAL_LINK_ITEMS: usize = 165;
 const TOTAL_IMAGE_ITEMS: usize = 9;
@@ -47,6 +55,15 @@ const NOTE_SNIPPETS: &[&str] = &[
     "Follow up on the import path override in the staging build.",
 ];
 
+/// `NOTE_SNIPPETS` split into words once, for the per-word lookups in
+/// `push_paragraph`.
+static NOTE_SNIPPET_WORDS: Lazy<Vec<Vec<&'static str>>> = Lazy::new(|| {
+    NOTE_SNIPPETS
+        .iter()
+        .map(|snippet| snippet.split_whitespace().collect())
+        .collect()
+});
+
 const URL_HOSTS: &[&str] = &[
     "docs.example.com",
     "api.example.com",
@@ -107,7 +124,11 @@ pub fn ensure_synthetic_benchmark_fixture(
     db_path: &Path,
     force_rebuild: bool,
 ) -> Result<SyntheticBenchSummary> {
-    if db_path.exists() && !force_rebuild {
+    let index_path = db_path
+        .parent()
+        .unwrap_or_else(|| Path::new("."))
+        .join(format!("tantivy_index_{}", crate::indexer::INDEX_VERSION));
+    if db_path.exists() && index_path.exists() && !force_rebuild && fixture_is_current(db_path) {
         return Ok(SyntheticBenchSummary {
             total_items: TOTAL_TEXT_ITEMS + TOTAL_LINK_ITEMS + TOTAL_IMAGE_ITEMS + TOTAL_FILE_ITEMS,
             total_text_bytes: expected_total_text_bytes(),
@@ -123,33 +144,52 @@ pub fn ensure_synthetic_benchmark_fixture(
         fs::remove_file(db_path)?;
     }
 
-    let db = Database::open(db_path)?;
-    let mut rng = StdRng::seed_from_u64(FIXTURE_SEED);
-    let mut total_text_bytes = 0usize;
+    let db = Database::open_for_bulk_load(db_path)?;
     let base_timestamp = chrono::Utc::now().timestamp();
+    let filler = build_filler_corpus(
+        LARGE_TEXT_TARGET_SIZES
+            .into_iter()
+            .chain(HUGE_TEXT_TARGET_SIZES)
+            .max()
+            .unwrap_or(0),
+    );
 
-    for (ordinal, spec) in fixture_specs().into_iter().enumerate() {
-        let (app_name, bundle_id) = SOURCE_APPS[rng.random_range(0..SOURCE_APPS.len())];
-        let mut item = build_item(spec, ordinal, &mut rng, app_name, bundle_id);
-        if let FixtureSpec::Text { .. } = spec {
-            total_text_bytes += item.text_content().len();
-        }
-        item.timestamp_unix = base_timestamp - ordinal as i64 * 90;
-        db.insert_item(&item)?;
-    }
+    // Every item draws from its own rng, seeded from its ordinal, so items can
+    // be synthesised in parallel and the fixture stays reproducible.
+    use rayon::prelude::*;
+    let specs = fixture_specs();
+    let items: Vec<StoredItem> = specs
+        .par_iter()
+        .enumerate()
+        .map(|(ordinal, &spec)| {
+            let mut rng = StdRng::seed_from_u64(FIXTURE_SEED.wrapping_add(ordinal as u64));
+            let (app_name, bundle_id) = SOURCE_APPS[rng.random_range(0..SOURCE_APPS.len())];
+            let mut item = build_item(spec, ordinal, &mut rng, app_name, bundle_id, &filler);
+            item.timestamp_unix = base_timestamp - ordinal as i64 * 90;
+            item
+        })
+        .collect();
+    let total_text_bytes: usize = specs
+        .iter()
+        .zip(&items)
+        .filter(|(spec, _)| matches!(spec, FixtureSpec::Text { .. }))
+        .map(|(_, item)| item.text_content().len())
+        .sum();
+    db.bulk_load_items(&items)?;
+    drop(items);
 
     drop(db);
 
-    let index_path = db_path
-        .parent()
-        .unwrap_or_else(|| Path::new("."))
-        .join(format!("tantivy_index_{}", crate::indexer::INDEX_VERSION));
     if index_path.exists() {
         fs::remove_dir_all(&index_path)?;
     }
 
     let store = ClipboardStore::new(db_path.to_string_lossy().to_string())?;
     store.rebuild_index()?;
+    drop(store);
+    // Stamped last, so a run that dies before the index is built leaves an
+    // unversioned DB that the next run regenerates.
+    rusqlite::Connection::open(db_path)?.pragma_update(None, "user_version", FIXTURE_VERSION)?;
 
     Ok(SyntheticBenchSummary {
         total_items: TOTAL_TEXT_ITEMS + TOTAL_LINK_ITEMS + TOTAL_IMAGE_ITEMS + TOTAL_FILE_ITEMS,
@@ -157,6 +197,13 @@ pub fn ensure_synthetic_benchmark_fixture(
     })
 }
 
+/// Whether the DB at `db_path` was built by this version of the generator.
+fn fixture_is_current(db_path: &Path) -> bool {
+    rusqlite::Connection::open_with_flags(db_path, rusqlite::OpenFlags::SQLITE_OPEN_READ_ONLY)
+        .and_then(|conn| conn.query_row("PRAGMA user_version", [], |row| row.get::<_, i32>(0)))
+        .is_ok_and(|version| version == FIXTURE_VERSION)
+}
+
 fn remove_sqlite_sidecars(db_path: &Path) -> Result<()> {
     let shm = PathBuf::from(format!("{}-shm", db_path.display()));
     let wal = PathBuf::from(format!("{}-wal", db_path.display()));
@@ -228,13 +275,14 @@ fn build_item(
     rng: &mut StdRng,
     app_name: &str,
     bundle_id: &str,
+    filler: &str,
 ) -> StoredItem {
     match spec {
         FixtureSpec::Text {
             size_class,
             target_size,
         } => StoredItem::new_text(
-            build_text_document(size_class, target_size, ordinal, rng),
+            build_text_document(size_class, target_size, ordinal, rng, filler),
             Some(app_name.to_string()),
             Some(bundle_id.to_string()),
         ),
@@ -288,51 +336,38 @@ fn build_text_document(
     target_size: usize,
     ordinal: usize,
     rng: &mut StdRng,
+    filler: &str,
 ) -> String {
-    let mut sections = Vec::new();
-    match size_class {
-        TextSizeClass::Tiny => {
-            sections.push(format!(
-                "note {}: {}",
-                ordinal,
-                NOTE_SNIPPETS[ordinal % NOTE_SNIPPETS.len()]
-            ));
-            if ordinal % 7 == 0 {
-                sections.push("function error return class".to_string());
-            }
-        }
-        TextSizeClass::Small | TextSizeClass::Medium => {
-            sections.push(CODE_SNIPPETS[ordinal % CODE_SNIPPETS.len()].to_string());
-            sections.push(format!(
-                "Context: {}",
-                NOTE_SNIPPETS[ordinal % NOTE_SNIPPETS.len()]
-            ));
-        }
-        TextSizeClass::Large | TextSizeClass::Huge => {
-            sections.push(format!(
-                "Large benchmark document {}.\nThis item is intentionally dense with search terms like function, error, class, return, import, async, and lorem ipsum.\n\n",
-                ordinal
-            ));
-            sections.push(CODE_SNIPPETS[ordinal % CODE_SNIPPETS.len()].repeat(8));
-        }
-    }
-
     let paragraph_target = match size_class {
         TextSizeClass::Tiny => 24,
         TextSizeClass::Small => 72,
         TextSizeClass::Medium => 180,
-        TextSizeClass::Large => 600,
-        TextSizeClass::Huge => 1_200,
+        TextSizeClass::Large | TextSizeClass::Huge => {
+            return build_large_document(target_size, ordinal, rng, filler);
+        }
     };
 
-    while sections.iter().map(|part| part.len()).sum::<usize>() < target_size {
-        sections.push(make_paragraph(paragraph_target, ordinal, rng));
-        if matches!(size_class, TextSizeClass::Large | TextSizeClass::Huge) {
-            sections.push(CODE_SNIPPETS[rng.random_range(0..CODE_SNIPPETS.len())].to_string());
+    // Paragraphs are appended straight into the document, which is then cut
+    // back to size in place; room for one paragraph of overshoot avoids a
+    // regrow on the last append.
+    let mut text = String::with_capacity(target_size + paragraph_target * 8 + 2);
+    let note = NOTE_SNIPPETS[ordinal % NOTE_SNIPPETS.len()];
+    if size_class == TextSizeClass::Tiny {
+        text.push_str(&format!("note {}: {}", ordinal, note));
+        if ordinal % 7 == 0 {
+            text.push_str("\n\nfunction error return class");
         }
+    } else {
+        text.push_str(CODE_SNIPPETS[ordinal % CODE_SNIPPETS.len()]);
+        text.push_str("\n\nContext: ");
+        text.push_str(note);
+    }
+
+    while text.len() < target_size {
+        text.push_str("\n\n");
+        push_paragraph(&mut text, paragraph_target, ordinal, rng);
     }
 
-    let mut text = sections.join("\n\n");
     while text.len() > target_size && !text.is_char_boundary(target_size) {
         text.pop();
     }
@@ -340,8 +375,58 @@ fn build_text_document(
     text
 }
 
-fn make_paragraph(word_count: usize, ordinal: usize, rng: &mut StdRng) -> String {
-    let mut words = Vec::with_capacity(word_count + 8);
+/// Large and Huge documents: a per-item header followed by a slice of the
+/// shared filler corpus taken at a random offset.
+fn build_large_document(
+    target_size: usize,
+    ordinal: usize,
+    rng: &mut StdRng,
+    filler: &str,
+) -> String {
+    let mut text = String::with_capacity(target_size);
+    text.push_str(&format!(
+        "Large benchmark document {}.\nThis item is intentionally dense with search terms like function, error, class, return, import, async, and lorem ipsum.\n\n",
+        ordinal
+    ));
+    text.push_str("\n\n");
+    text.push_str(&CODE_SNIPPETS[ordinal % CODE_SNIPPETS.len()].repeat(8));
+    text.push_str("\n\n");
+
+    // The corpus is pure ASCII, so any byte offset is a valid slice boundary.
+    let filler_len = target_size.saturating_sub(text.len()).min(filler.len());
+    let offset = rng.random_range(0..=filler.len() - filler_len);
+    text.push_str(&filler[offset..offset + filler_len]);
+    text.truncate(target_size);
+    text
+}
+
+/// Generates the filler text that every Large and Huge document is cut from.
+///
+/// Synthesising tens of megabytes word by word is the bulk of the fixture's
+/// build time, so it is done once, at the size of the largest document,
+/// instead of separately for each of them.
+fn build_filler_corpus(len: usize) -> String {
+    let mut rng = StdRng::seed_from_u64(FILLER_SEED);
+    let mut corpus = String::with_capacity(len + 16_384);
+    let mut paragraph_index = 0;
+    while corpus.len() < len {
+        push_paragraph(&mut corpus, 1_200, paragraph_index, &mut rng);
+        corpus.push_str("\n\n");
+        corpus.push_str(CODE_SNIPPETS[rng.random_range(0..CODE_SNIPPETS.len())]);
+        corpus.push_str("\n\n");
+        paragraph_index += 1;
+    }
+    debug_assert!(corpus.is_ascii());
+    corpus
+}
+
+/// Appends a generated paragraph of `word_count` words to `out`.
+fn push_paragraph(out: &mut String, word_count: usize, ordinal: usize, rng: &mut StdRng) {
+    let start = out.len();
+    // Words average well under eight bytes, so this covers the separators
+    // and the trailing period without regrowing.
+    out.reserve(word_count * 8);
+    let snippet_words = &*NOTE_SNIPPET_WORDS;
     for index in 0..word_count {
         let token = match (ordinal + index) % 11 {
             0 => "function",
@@ -352,19 +437,20 @@ fn make_paragraph(word_count: usize, ordinal: usize, rng: &mut StdRng) -> String
             5 => "ipsum",
             6 => "async",
             7 => "import",
-            _ => NOTE_SNIPPETS[rng.random_range(0..NOTE_SNIPPETS.len())]
-                .split_whitespace()
-                .nth((ordinal + index) % 5)
+            _ => snippet_words[rng.random_range(0..snippet_words.len())]
+                .get((ordinal + index) % 5)
+                .copied()
                 .unwrap_or("search"),
         };
-        words.push(token);
+        if index > 0 {
+            out.push(' ');
+        }
+        out.push_str(token);
     }
-    let mut paragraph = words.join(" ");
-    if let Some(first) = paragraph.get_mut(0..1) {
+    if let Some(first) = out.get_mut(start..start + 1) {
         first.make_ascii_uppercase();
     }
-    paragraph.push('.');
-    paragraph
+    out.push('.');
 }
 
 fn expected_total_text_bytes() -> usize {
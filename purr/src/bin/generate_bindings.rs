@@ -20,9 +20,11 @@
 //! │   Sources/ClipKittyRustWrapper/ClipKittyRust.swift ← Swift extensions       │
 //! └─────────────────────────────────────────────────────────────────────────────┘
 
+use std::borrow::Cow;
 use std::env;
 use std::fs;
-use std::path::PathBuf;
+use std::io::{self, BufRead};
+use std::path::{Path, PathBuf};
 use std::process::Command;
 
 fn main() {
@@ -69,25 +71,21 @@ fn main() {
 
     // Read and fix Swift 6 concurrency + module import
     println!("Copying generated Swift file...");
-    let mut swift_content =
+    let generated_swift =
         fs::read_to_string(generated.join("purr.swift")).expect("Read swift file");
-    swift_content = swift_content.replace(
-        "private var initializationResult",
-        "nonisolated(unsafe) private var initializationResult",
-    );
-    swift_content =
-        swift_content.replace("#if canImport(purrFFI)", "#if canImport(ClipKittyRustFFI)");
-    swift_content = swift_content.replace("import purrFFI", "import ClipKittyRustFFI");
-    fs::write(wrapper_dest.join("purr.swift"), swift_content).expect("Write swift");
+    let swift_content = patch_generated_swift(&generated_swift);
+    write_if_changed(&wrapper_dest.join("purr.swift"), swift_content.as_bytes())
+        .expect("Write swift");
 
     // Copy header
-    fs::copy(generated.join("purrFFI.h"), swift_dest.join("purrFFI.h")).expect("Copy header");
+    copy_if_changed(&generated.join("purrFFI.h"), &swift_dest.join("purrFFI.h"))
+        .expect("Copy header");
 
     // Write modulemap
     println!("Writing modulemap...");
-    fs::write(
-        swift_dest.join("module.modulemap"),
-        "module ClipKittyRustFFI {\n    header \"purrFFI.h\"\n    export *\n}\n",
+    write_if_changed(
+        &swift_dest.join("module.modulemap"),
+        b"module ClipKittyRustFFI {\n    header \"purrFFI.h\"\n    export *\n}\n",
     )
     .expect("Write modulemap");
 
@@ -124,6 +122,11 @@ fn main() {
                 &rust_dir,
             );
         }
+        // lipo always rewrites its output, so merge into the target dir and
+        // only replace the checked-in library when the slices changed.
+        let universal_dir = target_dir.join("universal-apple-darwin/release");
+        fs::create_dir_all(&universal_dir).expect("Create universal lib dir");
+        let universal_lib = universal_dir.join("libpurr.a");
         run_cmd(
             "lipo",
             &[
@@ -135,10 +138,11 @@ fn main() {
                     .join("x86_64-apple-darwin/release/libpurr.a")
                     .to_string_lossy(),
                 "-output",
-                &output_lib.to_string_lossy(),
+                &universal_lib.to_string_lossy(),
             ],
             &rust_dir,
         );
+        copy_if_changed(&universal_lib, &output_lib).expect("Copy universal static lib");
         println!("Created universal macOS static library");
     } else {
         let host_target = env::consts::ARCH;
@@ -152,8 +156,8 @@ fn main() {
             &["build", "--release", "--target", rust_target],
             &rust_dir,
         );
-        fs::copy(
-            target_dir.join(format!("{rust_target}/release/libpurr.a")),
+        copy_if_changed(
+            &target_dir.join(format!("{rust_target}/release/libpurr.a")),
             &output_lib,
         )
         .expect("Copy host static lib");
@@ -181,9 +185,9 @@ fn main() {
     );
     let ios_device_dir = swift_dest.join("ios-device");
     fs::create_dir_all(&ios_device_dir).expect("Create ios-device dir");
-    fs::copy(
-        target_dir.join("aarch64-apple-ios/release/libpurr.a"),
-        ios_device_dir.join("libpurr.a"),
+    copy_if_changed(
+        &target_dir.join("aarch64-apple-ios/release/libpurr.a"),
+        &ios_device_dir.join("libpurr.a"),
     )
     .expect("Copy iOS device static lib");
     println!("Copied iOS device static library");
@@ -198,9 +202,9 @@ fn main() {
     );
     let ios_sim_dir = swift_dest.join("ios-simulator");
     fs::create_dir_all(&ios_sim_dir).expect("Create ios-simulator dir");
-    fs::copy(
-        target_dir.join("aarch64-apple-ios-sim/release/libpurr.a"),
-        ios_sim_dir.join("libpurr.a"),
+    copy_if_changed(
+        &target_dir.join("aarch64-apple-ios-sim/release/libpurr.a"),
+        &ios_sim_dir.join("libpurr.a"),
     )
     .expect("Copy iOS simulator static lib");
     println!("Copied iOS simulator static library");
@@ -224,6 +228,76 @@ fn main() {
     println!("Note: ClipKittyRust.swift is a manually maintained file (not generated).");
 }
 
+/// Swift 6 concurrency + module-name fixups applied to the UniFFI output.
+const SWIFT_PATCHES: &[(&str, &str)] = &[
+    (
+        "private var initializationResult",
+        "nonisolated(unsafe) private var initializationResult",
+    ),
+    ("#if canImport(purrFFI)", "#if canImport(ClipKittyRustFFI)"),
+    ("import purrFFI", "import ClipKittyRustFFI"),
+];
+
+/// Apply `SWIFT_PATCHES` in one pass over the generated bindings.
+///
+/// The bindings are large and only a handful of lines need rewriting, so
+/// untouched lines are copied straight into a pre-sized buffer instead of
+/// materialising a full copy of the file for every replacement.
+fn patch_generated_swift(source: &str) -> String {
+    let mut patched = String::with_capacity(source.len() + 64);
+    for line in source.split_inclusive('\n') {
+        let mut line = Cow::Borrowed(line);
+        for &(from, to) in SWIFT_PATCHES {
+            if line.contains(from) {
+                line = Cow::Owned(line.replace(from, to));
+            }
+        }
+        patched.push_str(&line);
+    }
+    patched
+}
+
+/// Write `contents` to `path` only when they differ from what is already on
+/// disk. Unchanged outputs keep their mtime, so re-running the generator
+/// doesn't make Xcode recompile the wrapper module or relink the app.
+fn write_if_changed(path: &Path, contents: &[u8]) -> io::Result<()> {
+    if fs::read(path).is_ok_and(|existing| existing == contents) {
+        return Ok(());
+    }
+    fs::write(path, contents)
+}
+
+/// Copy `src` to `dst` unless `dst` already holds identical bytes. The
+/// static libraries are tens of MB, so lengths are compared first and
+/// contents are only streamed side by side when the lengths agree.
+fn copy_if_changed(src: &Path, dst: &Path) -> io::Result<()> {
+    if files_identical(src, dst).unwrap_or(false) {
+        return Ok(());
+    }
+    fs::copy(src, dst).map(|_| ())
+}
+
+fn files_identical(a: &Path, b: &Path) -> io::Result<bool> {
+    if fs::metadata(a)?.len() != fs::metadata(b)?.len() {
+        return Ok(false);
+    }
+    let mut a = io::BufReader::new(fs::File::open(a)?);
+    let mut b = io::BufReader::new(fs::File::open(b)?);
+    loop {
+        let a_chunk = a.fill_buf()?;
+        if a_chunk.is_empty() {
+            return Ok(b.fill_buf()?.is_empty());
+        }
+        let b_chunk = b.fill_buf()?;
+        let len = a_chunk.len().min(b_chunk.len());
+        if len == 0 || a_chunk[..len] != b_chunk[..len] {
+            return Ok(false);
+        }
+        a.consume(len);
+        b.consume(len);
+    }
+}
+
 fn run_cmd(program: &str, args: &[&str], dir: &PathBuf) {
     run_cmd_with_env(program, args, dir, &[]);
 }
@@ -301,6 +375,9 @@ fn ios_cross_env(sdk: &str) -> Vec<(String, String)> {
         "iphonesimulator" => ("aarch64-apple-ios-sim", "AARCH64_APPLE_IOS_SIM"),
         _ => panic!("Unsupported iOS SDK: {sdk}"),
     };
+    // cc-rs reads per-target overrides keyed by the target triple with `-`
+    // mapped to `_`; derive that suffix once for the CC/AR/CFLAGS entries.
+    let target_env_suffix = rust_target.replace('-', "_");
 
     // Build a CC wrapper command that forces the correct SDK and target.
     // This is necessary because inside Nix shells, CC points to a Nix-wrapped
@@ -316,12 +393,9 @@ fn ios_cross_env(sdk: &str) -> Vec<(String, String)> {
 
     vec![
         // Override CC/AR at the target-specific level (cargo uses these for build scripts)
-        (format!("CC_{}", rust_target.replace('-', "_")), cc.clone()),
-        (format!("AR_{}", rust_target.replace('-', "_")), ar.clone()),
-        (
-            format!("CFLAGS_{}", rust_target.replace('-', "_")),
-            cc_flags.clone(),
-        ),
+        (format!("CC_{target_env_suffix}"), cc.clone()),
+        (format!("AR_{target_env_suffix}"), ar.clone()),
+        (format!("CFLAGS_{target_env_suffix}"), cc_flags.clone()),
         // Also set the cargo linker override — this bypasses Nix's cc wrapper
         (
             format!("CARGO_TARGET_{cargo_target_upper}_LINKER"),
@@ -57,6 +57,24 @@ const GENERATED_ITEM_ID_SQL: &str = r#"lower(
     hex(randomblob(6))
 )"#;
 
+/// Secondary (non-unique) indexes on `items`, as (name, indexed columns).
+/// The single definition used by schema setup, the `item_id` migration and
+/// [`Database::bulk_load_items`], which drops them for the load and rebuilds
+/// them afterwards. The unique `item_id` index is not listed: it enforces an
+/// invariant rather than speeding up lookups.
+const ITEM_SECONDARY_INDEXES: &[(&str, &str)] = &[
+    ("idx_items_hash", "items(contentHash)"),
+    ("idx_items_timestamp", "items(timestamp)"),
+    ("idx_items_content_prefix", "items(content COLLATE NOCASE)"),
+];
+
+fn create_item_secondary_indexes(conn: &rusqlite::Connection) -> DatabaseResult<()> {
+    for (name, columns) in ITEM_SECONDARY_INDEXES {
+        conn.execute_batch(&format!("CREATE INDEX IF NOT EXISTS {name} ON {columns};"))?;
+    }
+    Ok(())
+}
+
 /// Intermediate row with raw content prefix; excerpt formatting is deferred to caller.
 struct RawRowMetadata {
     item_metadata: ItemMetadata,
@@ -200,13 +218,10 @@ fn enforce_non_null_item_ids(conn: &rusqlite::Connection) -> DatabaseResult<()>
 
             DROP TABLE items;
             ALTER TABLE items_new RENAME TO items;
-
-            CREATE INDEX IF NOT EXISTS idx_items_hash ON items(contentHash);
-            CREATE INDEX IF NOT EXISTS idx_items_timestamp ON items(timestamp);
-            CREATE INDEX IF NOT EXISTS idx_items_content_prefix ON items(content COLLATE NOCASE);
             "#
         );
         tx.execute_batch(&sql)?;
+        create_item_secondary_indexes(&tx)?;
         tx.commit()?;
         Ok(())
     })();
@@ -259,6 +274,31 @@ impl Database {
         Ok(db)
     }
 
+    /// Open a database for a one-shot bulk load such as the synthetic
+    /// benchmark fixture. Trades durability for speed: no syncs, temp tables
+    /// in memory and a large page cache, on a single pooled connection.
+    /// Never use this for the user's clipboard history.
+    pub(crate) fn open_for_bulk_load<P: AsRef<Path>>(path: P) -> DatabaseResult<Self> {
+        let manager = SqliteConnectionManager::file(path).with_init(|conn| {
+            conn.execute_batch(
+                "
+                    PRAGMA journal_mode=WAL;
+                    PRAGMA synchronous=OFF;
+                    PRAGMA foreign_keys=ON;
+                    PRAGMA temp_store=MEMORY;
+                    PRAGMA cache_size=-200000;
+                ",
+            )?;
+            Ok(())
+        });
+
+        let pool = Pool::builder().max_size(1).build(manager)?;
+
+        let db = Self { pool };
+        db.setup_schema()?;
+        Ok(db)
+    }
+
     /// Open an in-memory database (for testing)
     pub fn open_in_memory() -> DatabaseResult<Self> {
         let manager = SqliteConnectionManager::memory().with_init(|conn| {
@@ -355,9 +395,6 @@ impl Database {
                 previewTruncated INTEGER NOT NULL DEFAULT 0
             );
 
-            CREATE INDEX IF NOT EXISTS idx_items_hash ON items(contentHash);
-            CREATE INDEX IF NOT EXISTS idx_items_timestamp ON items(timestamp);
-            CREATE INDEX IF NOT EXISTS idx_items_content_prefix ON items(content COLLATE NOCASE);
             CREATE INDEX IF NOT EXISTS idx_file_items_item ON file_items(itemId);
 
             CREATE TABLE IF NOT EXISTS item_tags (
@@ -368,6 +405,7 @@ impl Database {
             CREATE INDEX IF NOT EXISTS idx_item_tags_tag ON item_tags(tag);
         "#,
         )?;
+        create_item_secondary_indexes(&conn)?;
 
         conn.execute(
             "INSERT OR IGNORE INTO item_tags (itemId, tag)
@@ -473,28 +511,51 @@ impl Database {
     pub fn insert_item(&self, item: &StoredItem) -> DatabaseResult<i64> {
         let conn = self.get_conn()?;
         let tx = conn.unchecked_transaction()?;
+        let item_id = Self::insert_item_rows(&tx, item)?;
+        tx.commit()?;
+        Ok(item_id)
+    }
+
+    /// Insert many clipboard items into a fresh database in one transaction,
+    /// for one-shot loads such as the benchmark fixture. Rather than updating
+    /// the secondary `items` indexes row by row, they are dropped for the load
+    /// and each rebuilt with a single sort at the end. Returns the item IDs in
+    /// input order.
+    pub(crate) fn bulk_load_items(&self, items: &[StoredItem]) -> DatabaseResult<Vec<i64>> {
+        let conn = self.get_conn()?;
+        let tx = conn.unchecked_transaction()?;
+        for (name, _) in ITEM_SECONDARY_INDEXES {
+            tx.execute_batch(&format!("DROP INDEX IF EXISTS {name};"))?;
+        }
+        let item_ids = items
+            .iter()
+            .map(|item| Self::insert_item_rows(&tx, item))
+            .collect::<DatabaseResult<Vec<_>>>()?;
+        create_item_secondary_indexes(&tx)?;
+        tx.commit()?;
+        Ok(item_ids)
+    }
 
+    fn insert_item_rows(tx: &rusqlite::Transaction<'_>, item: &StoredItem) -> DatabaseResult<i64> {
         let (timestamp_str, content_type, content_text) = Self::base_item_fields(item);
 
-        tx.execute(
+        tx.prepare_cached(
             r#"INSERT INTO items (item_id, contentType, contentHash, content, timestamp, sourceApp, sourceAppBundleId, thumbnail, colorRgba)
                VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9)"#,
-            params![
-                item.item_id,
-                content_type,
-                item.content_hash,
-                content_text,
-                timestamp_str,
-                item.source_app,
-                item.source_app_bundle_id,
-                item.thumbnail,
-                item.color_rgba,
-            ],
-        )?;
+        )?
+        .execute(params![
+            item.item_id,
+            content_type,
+            item.content_hash,
+            content_text,
+            timestamp_str,
+            item.source_app,
+            item.source_app_bundle_id,
+            item.thumbnail,
+            item.color_rgba,
+        ])?;
         let item_id = tx.last_insert_rowid();
-        Self::write_child_rows(&tx, item_id, item)?;
-
-        tx.commit()?;
+        Self::write_child_rows(tx, item_id, item)?;
         Ok(item_id)
     }
 
@@ -563,30 +624,28 @@ impl Database {
     ) -> DatabaseResult<()> {
         match &item.content {
             ClipboardContent::Text { value } | ClipboardContent::Color { value } => {
-                tx.execute(
-                    "INSERT INTO text_items (itemId, value) VALUES (?1, ?2)",
-                    params![item_id, value],
-                )?;
+                tx.prepare_cached("INSERT INTO text_items (itemId, value) VALUES (?1, ?2)")?
+                    .execute(params![item_id, value])?;
             }
             ClipboardContent::Image {
                 data,
                 description,
                 is_animated,
             } => {
-                tx.execute(
+                tx.prepare_cached(
                     "INSERT INTO image_items (itemId, data, description, is_animated) VALUES (?1, ?2, ?3, ?4)",
-                    params![item_id, data, description, *is_animated as i32],
-                )?;
+                )?
+                .execute(params![item_id, data, description, *is_animated as i32])?;
             }
             ClipboardContent::Link {
                 url,
                 metadata_state,
             } => {
                 let (title, description, _) = metadata_state.to_database_fields();
-                tx.execute(
+                tx.prepare_cached(
                     "INSERT INTO link_items (itemId, url, title, description) VALUES (?1, ?2, ?3, ?4)",
-                    params![item_id, url, title, description],
-                )?;
+                )?
+                .execute(params![item_id, url, title, description])?;
             }
             ClipboardContent::File { files, .. } => {
                 for (ordinal, file) in files.iter().enumerate() {
@@ -597,27 +656,27 @@ impl Database {
                         preview_data,
                         preview_truncated,
                     ) = Self::file_preview_database_fields(&file.preview);
-                    tx.execute(
+                    tx.prepare_cached(
                         r#"INSERT INTO file_items
                            (itemId, ordinal, path, filename, fileSize, uti, bookmarkData, fileStatus,
                             previewKind, previewReason, previewText, previewData, previewTruncated)
                            VALUES (?1, ?2, ?3, ?4, ?5, ?6, ?7, ?8, ?9, ?10, ?11, ?12, ?13)"#,
-                        params![
-                            item_id,
-                            ordinal as i64,
-                            file.path,
-                            file.filename,
-                            file.file_size as i64,
-                            file.uti,
-                            file.bookmark_data,
-                            file.file_status.to_database_str(),
-                            preview_kind,
-                            preview_reason,
-                            preview_text,
-                            preview_data,
-                            preview_truncated,
-                        ],
-                    )?;
+                    )?
+                    .execute(params![
+                        item_id,
+                        ordinal as i64,
+                        file.path,
+                        file.filename,
+                        file.file_size as i64,
+                        file.uti,
+                        file.bookmark_data,
+                        file.file_status.to_database_str(),
+                        preview_kind,
+                        preview_reason,
+                        preview_text,
+                        preview_data,
+                        preview_truncated,
+                    ])?;
                 }
             }
         }
@@ -1742,6 +1801,49 @@ mod tests {
         );
     }
 
+    #[test]
+    fn test_bulk_load_items_returns_ids_in_input_order() {
+        let db = Database::open_in_memory().unwrap();
+        let texts = ["first", "second", "third"];
+        let items = texts
+            .into_iter()
+            .map(|text| StoredItem::new_text(text.to_string(), None, None))
+            .collect::<Vec<_>>();
+
+        let ids = db.bulk_load_items(&items).unwrap();
+        assert_eq!(ids.len(), texts.len());
+
+        for (id, expected) in ids.iter().zip(texts) {
+            let fetched = db.fetch_items_by_ids(&[*id]).unwrap();
+            assert_eq!(fetched.len(), 1);
+            assert_eq!(fetched[0].text_content(), expected);
+        }
+    }
+
+    #[test]
+    fn test_bulk_load_items_restores_secondary_indexes() {
+        let db = Database::open_in_memory().unwrap();
+        let items = ["alpha", "beta"]
+            .into_iter()
+            .map(|text| StoredItem::new_text(text.to_string(), None, None))
+            .collect::<Vec<_>>();
+
+        let ids = db.bulk_load_items(&items).unwrap();
+        assert_eq!(ids.len(), 2);
+
+        let conn = db.get_conn().unwrap();
+        for (name, _) in ITEM_SECONDARY_INDEXES {
+            let exists: bool = conn
+                .query_row(
+                    "SELECT EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?1)",
+                    params![name],
+                    |row| row.get(0),
+                )
+                .unwrap();
+            assert!(exists, "{name} was not rebuilt");
+        }
+    }
+
     #[test]
     fn test_new_schema_requires_non_null_item_id() {
         let db = Database::open_in_memory().unwrap();
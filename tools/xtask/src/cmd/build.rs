@@ -6,6 +6,7 @@
 
 use std::fs;
 use std::os::unix::fs::PermissionsExt;
+use std::time::SystemTime;
 
 use anyhow::{anyhow, Context, Result};
 use camino::{Utf8Path, Utf8PathBuf};
@@ -63,24 +64,18 @@ pub(crate) fn generate(repo: &RepoRoot, dry_run: bool, reporter: &Reporter) -> R
     let out_link =
         nix::build_out_link(reporter, repo.as_path(), "clipkitty-generated", "generated")?;
 
-    remove_path(&repo.join(format!("{APP_NAME}.xcworkspace")))?;
-    remove_path(&repo.join(format!("{APP_NAME}.xcodeproj")))?;
+    let workspace = format!("{APP_NAME}.xcworkspace");
+    let project = format!("{APP_NAME}.xcodeproj");
+    remove_path(&repo.join(&workspace))?;
+    remove_path(&repo.join(&project))?;
     remove_path(&repo.join("Tuist/.build"))?;
     remove_path(&repo.join("Derived"))?;
     for stray in STRAY_SWIFTPM {
         remove_path(&repo.join(stray))?;
     }
 
-    copy_dir(
-        reporter,
-        &out_link.join(format!("{APP_NAME}.xcworkspace")),
-        &repo.join(format!("{APP_NAME}.xcworkspace")),
-    )?;
-    copy_dir(
-        reporter,
-        &out_link.join(format!("{APP_NAME}.xcodeproj")),
-        &repo.join(format!("{APP_NAME}.xcodeproj")),
-    )?;
+    copy_dir(reporter, &out_link.join(&workspace), &repo.join(&workspace))?;
+    copy_dir(reporter, &out_link.join(&project), &repo.join(&project))?;
 
     let staged_tuist_build = out_link.join("Tuist/.build");
     if staged_tuist_build.as_std_path().is_dir() {
@@ -106,10 +101,10 @@ pub(crate) fn generate(repo: &RepoRoot, dry_run: bool, reporter: &Reporter) -> R
     }
 
     for rel in [
-        &format!("{APP_NAME}.xcworkspace"),
-        &format!("{APP_NAME}.xcodeproj"),
-        &String::from("Tuist/.build"),
-        &String::from("Derived"),
+        workspace.as_str(),
+        project.as_str(),
+        "Tuist/.build",
+        "Derived",
     ] {
         let p = repo.join(rel);
         if p.as_std_path().exists() {
@@ -482,11 +477,19 @@ fn copy_dir(reporter: &Reporter, src: &Utf8Path, dst: &Utf8Path) -> Result<()> {
         .run()
 }
 
+/// Plain files don't need `cp`'s bundle handling: `fs::copy` does the copy
+/// in-process (fcopyfile / clonefile on macOS) instead of spawning a
+/// subprocess for every staged overlay file.
 fn copy_file(reporter: &Reporter, src: &Utf8Path, dst: &Utf8Path) -> Result<()> {
-    Runner::new(reporter, "cp")
-        .arg(src.as_std_path())
-        .arg(dst.as_std_path())
-        .run()
+    reporter.trace_command(&format!("cp {src} {dst}"));
+    fs::copy(src.as_std_path(), dst.as_std_path())
+        .with_context(|| format!("copying {src} to {dst}"))?;
+    // On macOS the copy also carries over the nix store's epoch-1 mtime;
+    // stamp it like `cp` did so Xcode's staleness checks see the new file.
+    fs::File::open(dst.as_std_path())
+        .and_then(|file| file.set_modified(SystemTime::now()))
+        .with_context(|| format!("touching {dst}"))?;
+    Ok(())
 }
 
 fn make_user_writable(path: &Utf8Path) -> Result<()> {
@@ -5,19 +5,22 @@
 //! `ffmpeg`), but sequencing, locale selection, DB preparation, and file
 //! layout are all owned here.
 
-use std::collections::{hash_map::DefaultHasher, BTreeMap};
+use std::collections::{hash_map::DefaultHasher, BTreeMap, HashSet};
 use std::env;
 use std::fs;
 use std::hash::{Hash, Hasher};
+use std::io;
+use std::path::PathBuf;
 use std::thread;
 use std::time::Duration;
 
 use anyhow::{anyhow, Context, Result};
 use camino::{Utf8Path, Utf8PathBuf};
 use chrono::{Duration as ChronoDuration, Local, NaiveDateTime};
-use rusqlite::{params, Connection, OptionalExtension};
+use rusqlite::{params, Connection, MAIN_DB};
 use serde::Deserialize;
-use uuid::Uuid;
+use tempfile::TempDir;
+use uuid::Builder as UuidBuilder;
 
 use crate::cli::{MarketingCmd, ScreenshotPlatform};
 use crate::cmd::build;
@@ -873,19 +876,37 @@ fn copy_screenshots(
     let locale_code = locale.as_code();
     let prefix = screenshot_source_prefix(plan.platform, locale);
     let target_dir = repo.join(format!("{}/{}", plan.marketing_root, locale_code));
-    let mut copied = 0usize;
 
     let specs = plan.platform.capture_specs();
     for &(index, _) in specs {
         remove_if_exists(&target_dir.join(format!("screenshot_{index}.png")))?;
     }
 
-    for &(index, suffix) in specs {
-        let source = screenshot_source_path(&prefix, index, suffix);
-        let target = target_dir.join(format!("screenshot_{index}.png"));
-        if source.as_std_path().is_file() {
-            fs::copy(source.as_std_path(), target.as_std_path())
-                .with_context(|| format!("copying {source} to {target}"))?;
+    // Each capture is an independent multi-MB PNG, so copy them concurrently.
+    let results = thread::scope(|scope| {
+        let handles = specs
+            .iter()
+            .map(|&(index, suffix)| {
+                let source = screenshot_source_path(&prefix, index, suffix);
+                let target = target_dir.join(format!("screenshot_{index}.png"));
+                scope.spawn(move || -> Result<bool> {
+                    if !source.as_std_path().is_file() {
+                        return Ok(false);
+                    }
+                    fs::copy(source.as_std_path(), target.as_std_path())
+                        .with_context(|| format!("copying {source} to {target}"))?;
+                    Ok(true)
+                })
+            })
+            .collect::<Vec<_>>();
+        handles
+            .into_iter()
+            .map(|handle| handle.join().expect("screenshot copy thread panicked"))
+            .collect::<Vec<_>>()
+    });
+    let mut copied = 0usize;
+    for result in results {
+        if result? {
             copied += 1;
         }
     }
@@ -1058,6 +1079,9 @@ impl ImageFilter {
     }
 }
 
+/// Upper bound on concurrent image preparations (each may run `sips`).
+const MAX_IMAGE_PREP_WORKERS: usize = 8;
+
 fn inject_images_impl(
     repo: &RepoRoot,
     db_path: &Utf8Path,
@@ -1084,6 +1108,17 @@ fn inject_images_impl(
 
     let mut conn =
         Connection::open(db_path.as_std_path()).with_context(|| format!("opening {db_path}"))?;
+    // The demo DB is regenerated from scratch whenever it is lost, so skip
+    // the per-commit syncs. The journal mode is left alone: these files are
+    // bundled as-is and must not be flipped into WAL.
+    conn.execute_batch(
+        "
+        PRAGMA synchronous=OFF;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-200000;
+        ",
+    )
+    .with_context(|| format!("configuring {db_path}"))?;
     ensure_locale_column(&conn)?;
 
     let base_timestamp: NaiveDateTime = conn
@@ -1097,8 +1132,12 @@ fn inject_images_impl(
         .unwrap_or_else(|| Local::now().naive_local());
 
     let tx = conn.transaction()?;
-    let mut inserted = 0usize;
+    // One query up front instead of a dedup SELECT per manifest image. Rows
+    // inserted below are added to the set too, so repeated descriptions in
+    // the manifest are still only injected once.
+    let mut existing_descriptions = existing_image_descriptions(&tx, locale)?;
     let mut skipped_for_locale = 0usize;
+    let mut pending = Vec::new();
     for item in manifest {
         if !filter.keep(&item) {
             continue;
@@ -1120,29 +1159,68 @@ fn inject_images_impl(
             .get(&item.description_en)
             .cloned()
             .unwrap_or_else(|| item.description_en.clone());
-        let already_exists: Option<i64> = tx
-            .query_row(
-                "SELECT 1 FROM image_items WHERE description = ?1 AND locale = ?2 LIMIT 1",
-                params![description, locale.as_code()],
-                |row| row.get(0),
-            )
-            .optional()?;
-        if already_exists.is_some() {
+        if !existing_descriptions.insert(description.clone()) {
             continue;
         }
+        pending.push((item, description, image_path, thumb_path));
+    }
+
+    // Transcoding through sips and reading thumbnails are independent for
+    // every image, so a small pool of workers prepares them concurrently;
+    // only the inserts below have to run in order on the one connection.
+    let workers = thread::available_parallelism()
+        .map_or(1, |count| count.get())
+        .min(MAX_IMAGE_PREP_WORKERS)
+        .min(pending.len())
+        .max(1);
+    let next_image = std::sync::atomic::AtomicUsize::new(0);
+    let (queue, next_image) = (&pending, &next_image);
+    let prepared = thread::scope(|scope| {
+        let handles = (0..workers)
+            .map(|_| {
+                scope.spawn(move || {
+                    let mut done = Vec::new();
+                    loop {
+                        let index = next_image.fetch_add(1, std::sync::atomic::Ordering::Relaxed);
+                        let Some((_, _, image_path, thumb_path)) = queue.get(index) else {
+                            break done;
+                        };
+                        let image = injectable_image(image_path);
+                        let thumbnail = fs::read(thumb_path.as_std_path()).ok();
+                        done.push((index, image.map(|image| (image, thumbnail))));
+                    }
+                })
+            })
+            .collect::<Vec<_>>();
+        let mut prepared = handles
+            .into_iter()
+            .flat_map(|handle| handle.join().expect("image preparation thread panicked"))
+            .collect::<Vec<_>>();
+        prepared.sort_unstable_by_key(|&(index, _)| index);
+        prepared
+            .into_iter()
+            .map(|(_, prepared)| prepared)
+            .collect::<Vec<_>>()
+    });
 
-        let image_data = injectable_image_bytes(&image_path)?;
-        let thumbnail = fs::read(thumb_path.as_std_path()).ok();
+    let mut inserted = 0usize;
+    for ((item, description, _, _), prepared) in pending.into_iter().zip(prepared) {
+        let (image, thumbnail) = prepared?;
         let timestamp =
             base_timestamp + ChronoDuration::seconds(item.offset_seconds.unwrap_or(-3600));
         let timestamp = timestamp.format("%Y-%m-%d %H:%M:%S").to_string();
-        let content_hash = stable_hash(&(description.as_str(), image_data.len(), locale.as_code()));
-        let item_uuid = Uuid::new_v4().to_string();
-
-        tx.execute(
-            "INSERT INTO items (item_id, contentType, contentHash, content, timestamp, sourceApp, sourceAppBundleId, thumbnail)
-             VALUES (?1, 'image', ?2, ?3, ?4, ?5, ?6, ?7)",
-            params![
+        let content_hash =
+            stable_hash(&(description.as_str(), image.len as usize, locale.as_code()));
+        let item_uuid = stable_item_uuid(&content_hash);
+
+        // Cached statements: each INSERT is parsed and planned once per run
+        // rather than once per image.
+        let item_id = tx
+            .prepare_cached(
+                "INSERT INTO items (item_id, contentType, contentHash, content, timestamp, sourceApp, sourceAppBundleId, thumbnail)
+                 VALUES (?1, 'image', ?2, ?3, ?4, ?5, ?6, ?7)",
+            )?
+            .insert(params![
                 item_uuid,
                 content_hash,
                 description,
@@ -1150,13 +1228,12 @@ fn inject_images_impl(
                 item.source_app,
                 item.bundle_id,
                 thumbnail,
-            ],
-        )?;
-        let item_id = tx.last_insert_rowid();
-        tx.execute(
-            "INSERT INTO image_items (itemId, data, description, locale) VALUES (?1, ?2, ?3, ?4)",
-            params![item_id, image_data, description, locale.as_code()],
-        )?;
+            ])?;
+        tx.prepare_cached(
+            "INSERT INTO image_items (itemId, data, description, locale) VALUES (?1, zeroblob(?2), ?3, ?4)",
+        )?
+        .execute(params![item_id, image.len as i64, description, locale.as_code()])?;
+        image.stream_into(&tx, item_id)?;
         inserted += 1;
     }
     tx.commit()?;
@@ -1174,7 +1251,22 @@ fn inject_images_impl(
     Ok(())
 }
 
-/// Bytes to inject into the demo DB for a manifest image, transcoding HEIC
+/// Descriptions of the image rows already stored for `locale`.
+fn existing_image_descriptions(
+    conn: &Connection,
+    locale: MarketingLocale,
+) -> Result<HashSet<String>> {
+    let mut stmt = conn.prepare("SELECT description FROM image_items WHERE locale = ?1")?;
+    let descriptions = stmt
+        .query_map(params![locale.as_code()], |row| {
+            row.get::<_, Option<String>>(0)
+        })?
+        .filter_map(|description| description.transpose())
+        .collect::<rusqlite::Result<_>>()?;
+    Ok(descriptions)
+}
+
+/// File to inject into the demo DB for a manifest image, transcoding HEIC
 /// sources to JPEG via `sips` (present on every macOS host).
 ///
 /// HEIC stills are HEVC-coded, and the iOS simulator on virtualized CI
@@ -1185,12 +1277,12 @@ fn inject_images_impl(
 /// pool thread, the pool starves, and the iPad screenshot test dies with
 /// "Timed out while evaluating UI query". JPEG decodes through ImageIO on
 /// every host and looks identical in the captures, so inject that instead.
-fn injectable_image_bytes(image_path: &Utf8Path) -> Result<Vec<u8>> {
+fn injectable_image(image_path: &Utf8Path) -> Result<InjectableImage> {
     let is_heic = image_path
         .extension()
         .is_some_and(|ext| ext.eq_ignore_ascii_case("heic"));
     if !is_heic {
-        return fs::read(image_path.as_std_path()).with_context(|| format!("reading {image_path}"));
+        return InjectableImage::new(image_path.as_std_path().to_path_buf(), None);
     }
 
     let temp_dir = tempfile::tempdir().context("creating transcode temp dir")?;
@@ -1211,7 +1303,42 @@ fn injectable_image_bytes(image_path: &Utf8Path) -> Result<Vec<u8>> {
             String::from_utf8_lossy(&output.stderr)
         ));
     }
-    fs::read(&jpeg_path).with_context(|| format!("reading transcoded {}", jpeg_path.display()))
+    InjectableImage::new(jpeg_path, Some(temp_dir))
+}
+
+/// An image file queued for injection, streamed into its `image_items` row
+/// rather than read into memory and bound as one parameter.
+struct InjectableImage {
+    path: PathBuf,
+    len: u64,
+    /// Keeps a transcoded JPEG alive until it has been copied into the DB.
+    _transcode_dir: Option<TempDir>,
+}
+
+impl InjectableImage {
+    fn new(path: PathBuf, transcode_dir: Option<TempDir>) -> Result<Self> {
+        let len = fs::metadata(&path)
+            .with_context(|| format!("reading {}", path.display()))?
+            .len();
+        Ok(Self {
+            path,
+            len,
+            _transcode_dir: transcode_dir,
+        })
+    }
+
+    /// Copies the file into the `zeroblob` placeholder already inserted as
+    /// `image_items.data` for `item_id`.
+    fn stream_into(&self, conn: &Connection, item_id: i64) -> Result<()> {
+        let mut blob = conn
+            .blob_open(MAIN_DB, "image_items", "data", item_id, false)
+            .with_context(|| format!("opening image blob for item {item_id}"))?;
+        let mut file = fs::File::open(&self.path)
+            .with_context(|| format!("reading {}", self.path.display()))?;
+        io::copy(&mut file, &mut blob)
+            .with_context(|| format!("streaming {} into the DB", self.path.display()))?;
+        Ok(())
+    }
 }
 
 #[derive(Debug, Deserialize)]
@@ -1317,6 +1444,21 @@ fn stable_hash(value: &impl Hash) -> String {
     hasher.finish().to_string()
 }
 
+/// Name-keyed `item_id` for an injected row. The same image, size and locale
+/// always map to the same ID, so rebuilding a demo DB is reproducible instead
+/// of minting fresh random UUIDs on every run.
+fn stable_item_uuid(content_hash: &str) -> String {
+    let mut bytes = [0u8; 16];
+    for (half, chunk) in bytes.chunks_exact_mut(8).enumerate() {
+        let mut hasher = DefaultHasher::new();
+        (half, content_hash).hash(&mut hasher);
+        chunk.copy_from_slice(&hasher.finish().to_be_bytes());
+    }
+    UuidBuilder::from_custom_bytes(bytes)
+        .into_uuid()
+        .to_string()
+}
+
 fn record_preview_video(
     repo: &RepoRoot,
     test_name: &str,
@@ -1758,8 +1900,8 @@ fn tool_exists(name: &str) -> bool {
 #[cfg(test)]
 mod tests {
     use super::{
-        copy_base_database_without_images, screenshot_source_prefix, CapturePlatform,
-        IosDeviceKind, LocaleAsset, ManifestItem, MarketingLocale, ScreenshotCopy,
+        copy_base_database_without_images, screenshot_source_prefix, stable_item_uuid,
+        CapturePlatform, IosDeviceKind, LocaleAsset, ManifestItem, MarketingLocale, ScreenshotCopy,
         MARKETING_LOCALES_ENV,
     };
     use camino::Utf8PathBuf;
@@ -2017,4 +2159,17 @@ mod tests {
         // Locale without an entry still falls through to None.
         assert!(item.asset_for(MarketingLocale::Ja).is_none());
     }
+
+    #[test]
+    fn injected_item_ids_are_stable_per_content_hash() {
+        let first = stable_item_uuid("12345");
+        assert_eq!(first, stable_item_uuid("12345"));
+        assert_ne!(first, stable_item_uuid("12346"));
+        assert_eq!(
+            uuid::Uuid::parse_str(&first)
+                .expect("valid uuid")
+                .get_version_num(),
+            8
+        );
+    }
 }
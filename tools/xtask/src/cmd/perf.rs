@@ -5,7 +5,9 @@
 
 use std::collections::BTreeMap;
 use std::env;
+use std::fmt::Write as _;
 use std::fs;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 use std::process::Command;
 use std::thread;
@@ -39,6 +41,7 @@ const PERF_QUERIES: &[&str] = &[
 ];
 const DEFAULT_TYPING_DELAY_MS: u64 = 100;
 const DEFAULT_IGNORE_FIRST_SECONDS: f64 = 3.0;
+const TOP_EVENT_COUNT: usize = 10;
 
 pub fn run(args: &PerfArgs, dry_run: bool, reporter: &Reporter) -> Result<()> {
     let _ = SideEffectLevel::LocalMutation;
@@ -174,11 +177,7 @@ fn run_perf(repo: &RepoRoot, args: &PerfArgs, dry_run: bool, reporter: &Reporter
         DEFAULT_IGNORE_FIRST_SECONDS * 1000.0,
         reporter,
     )?;
-    fs::write(
-        report_file.as_std_path(),
-        format!("{}\n", serde_json::to_string_pretty(&report)?),
-    )
-    .with_context(|| format!("writing {report_file}"))?;
+    write_report(&report_file, &report).with_context(|| format!("writing {report_file}"))?;
     print_report(&report, reporter);
     reporter.info(&format!("JSON report: {report_file}"));
     reporter.info(&format!("Simulation log: {log_file}"));
@@ -191,26 +190,25 @@ fn run_perf(repo: &RepoRoot, args: &PerfArgs, dry_run: bool, reporter: &Reporter
     Ok(())
 }
 
-fn ensure_perf_fixture(repo: &RepoRoot, reporter: &Reporter) -> Result<()> {
-    let fixture_dir = repo.join("purr/generated/benchmarks");
-    let fixture_db = fixture_dir.join("synthetic_clipboard.sqlite");
-    let has_index = fs::read_dir(fixture_dir.as_std_path())
-        .ok()
-        .into_iter()
-        .flat_map(|entries| entries.flatten())
-        .any(|entry| {
-            entry
-                .file_name()
-                .to_string_lossy()
-                .starts_with("tantivy_index_")
-        });
+/// Serializes the report straight into a buffered file rather than building
+/// the whole pretty-printed JSON string first.
+fn write_report(path: &Utf8Path, report: &AnalysisReport) -> Result<()> {
+    let mut writer = BufWriter::new(fs::File::create(path.as_std_path())?);
+    serde_json::to_writer_pretty(&mut writer, report)?;
+    writer.write_all(b"\n")?;
+    writer.flush()?;
+    Ok(())
+}
 
-    if fixture_db.as_std_path().is_file() && has_index {
-        reporter.info(">>> Using existing performance database and index");
-        return Ok(());
-    }
+/// Synthetic benchmark DB handed to the app; its tantivy index is built next
+/// to it in the same directory.
+const PERF_FIXTURE_DIR: &str = "purr/generated/benchmarks";
+const PERF_FIXTURE_DB: &str = "synthetic_clipboard.sqlite";
 
-    reporter.info(">>> Generating performance test database and index...");
+/// Always runs `generate-perf-db`: it reuses the fixture when the DB's
+/// version stamp and index are current, so staleness is decided in one place.
+fn ensure_perf_fixture(repo: &RepoRoot, reporter: &Reporter) -> Result<()> {
+    reporter.info(">>> Ensuring performance test database and index...");
     let mut runner = Runner::new(reporter, "cargo")
         .args([
             "run",
@@ -224,13 +222,21 @@ fn ensure_perf_fixture(repo: &RepoRoot, reporter: &Reporter) -> Result<()> {
     if locked_cargo() {
         runner = runner.arg("--locked");
     }
-    runner.run()
+    runner
+        .arg("--")
+        .arg("--output")
+        .arg(
+            repo.join(PERF_FIXTURE_DIR)
+                .join(PERF_FIXTURE_DB)
+                .as_std_path(),
+        )
+        .run()
 }
 
 fn setup_perf_database(repo: &RepoRoot, reporter: &Reporter) -> Result<()> {
     reporter.info(">>> Setting up test database...");
-    let fixture_dir = repo.join("purr/generated/benchmarks");
-    let fixture_db = fixture_dir.join("synthetic_clipboard.sqlite");
+    let fixture_dir = repo.join(PERF_FIXTURE_DIR);
+    let fixture_db = fixture_dir.join(PERF_FIXTURE_DB);
     let app_support = app_support_dir()?;
     fs::create_dir_all(app_support.as_std_path())
         .with_context(|| format!("creating {app_support}"))?;
@@ -444,10 +450,9 @@ fn analyze_trace(
     ignore_first_ms: f64,
     reporter: &Reporter,
 ) -> Result<AnalysisReport> {
-    let tempdir = TempDir::new().context("creating temporary directory for xctrace export")?;
-    let xml_paths = export_trace_data(trace_path, tempdir.path(), quiet, reporter)?;
+    let exports = export_trace_data(trace_path, quiet, reporter)?;
 
-    if xml_paths.is_empty() {
+    if exports.is_empty() {
         return Ok(AnalysisReport {
             trace_file: trace_path.to_string(),
             hang_threshold_ms,
@@ -468,91 +473,85 @@ fn analyze_trace(
 
     let mut hangs = Vec::new();
     let mut stutters = Vec::new();
-    let mut all_durations = Vec::new();
+    let mut durations = DurationStats::default();
     let mut all_main_thread_gaps = Vec::new();
-    for path in &xml_paths {
-        let (file_hangs, file_stutters, file_durations, file_gaps) =
-            parse_time_profile(path, hang_threshold_ms, stutter_threshold_ms)?;
+    for export in &exports {
+        let (file_hangs, file_stutters, file_gaps) = parse_time_profile(
+            export,
+            hang_threshold_ms,
+            stutter_threshold_ms,
+            &mut durations,
+        )?;
         hangs.extend(file_hangs);
         stutters.extend(file_stutters);
-        all_durations.extend(file_durations);
         all_main_thread_gaps.extend(file_gaps);
     }
 
-    let all_timestamps = all_main_thread_gaps
+    let trace_start_ms = all_main_thread_gaps
         .iter()
         .map(|gap| gap.timestamp_ms)
         .filter(|ts| *ts > 0.0)
-        .collect::<Vec<_>>();
-    let trace_start_ms = all_timestamps.into_iter().reduce(f64::min).unwrap_or(0.0);
+        .reduce(f64::min)
+        .unwrap_or(0.0);
     if ignore_first_ms > 0.0 {
         let cutoff = trace_start_ms + ignore_first_ms;
         all_main_thread_gaps.retain(|gap| gap.timestamp_ms > cutoff);
     }
 
-    let total_samples = all_durations.len();
+    let total_samples = durations.count;
     let total_hang_duration = hangs.iter().map(|hang| hang.duration_ms).sum::<f64>();
     let total_stutter_duration = stutters
         .iter()
         .map(|stutter| stutter.duration_ms)
         .sum::<f64>();
 
-    let non_idle_gaps = all_main_thread_gaps
-        .iter()
-        .filter(|gap| !gap.is_idle)
-        .cloned()
-        .collect::<Vec<_>>();
-    if !non_idle_gaps.is_empty() {
-        for gap in &non_idle_gaps {
-            let event = HangEvent {
-                duration_ms: gap.duration_ms,
-                timestamp_ms: gap.timestamp_ms,
-                function: gap.function.clone(),
-                backtrace: gap.backtrace.clone(),
-                is_hang: gap.duration_ms >= hang_threshold_ms,
-            };
-            if event.is_hang {
-                if !hangs.contains(&event) {
-                    hangs.push(event);
-                }
-            } else if gap.duration_ms >= stutter_threshold_ms && !stutters.contains(&event) {
-                stutters.push(event);
-            }
+    // Only non-idle gaps at or above the stutter threshold can become events;
+    // everything shorter just feeds the max, so it skips the event clone and
+    // the duplicate scans below.
+    let mut max_non_idle_gap: Option<f64> = None;
+    for gap in all_main_thread_gaps.iter().filter(|gap| !gap.is_idle) {
+        max_non_idle_gap =
+            Some(max_non_idle_gap.map_or(gap.duration_ms, |max| max.max(gap.duration_ms)));
+        let is_hang = gap.duration_ms >= hang_threshold_ms;
+        if !is_hang && gap.duration_ms < stutter_threshold_ms {
+            continue;
+        }
+        let event = HangEvent {
+            duration_ms: gap.duration_ms,
+            timestamp_ms: gap.timestamp_ms,
+            function: gap.function.clone(),
+            backtrace: gap.backtrace.clone(),
+            is_hang,
+        };
+        let events = if is_hang { &mut hangs } else { &mut stutters };
+        if !events.contains(&event) {
+            events.push(event);
         }
     }
 
-    let max_duration = non_idle_gaps
-        .iter()
-        .map(|gap| gap.duration_ms)
-        .reduce(f64::max)
+    let max_duration = max_non_idle_gap
         .or_else(|| {
             all_main_thread_gaps
                 .iter()
                 .map(|gap| gap.duration_ms)
                 .reduce(f64::max)
         })
-        .or_else(|| all_durations.iter().copied().reduce(f64::max))
+        .or(durations.max_ms)
         .unwrap_or(0.0);
-    let avg_duration = if all_durations.is_empty() {
-        0.0
-    } else {
-        all_durations.iter().sum::<f64>() / all_durations.len() as f64
-    };
+    let avg_duration = durations.average_ms();
     let p95_duration = if all_main_thread_gaps.is_empty() {
         0.0
     } else {
-        let mut sorted = all_main_thread_gaps
+        let mut gap_durations = all_main_thread_gaps
             .iter()
             .map(|gap| gap.duration_ms)
             .collect::<Vec<_>>();
-        sorted.sort_by(f64::total_cmp);
-        let index = ((sorted.len() as f64) * 0.95).floor() as usize;
-        sorted[index.min(sorted.len() - 1)]
+        let index = ((gap_durations.len() as f64) * 0.95).floor() as usize;
+        let index = index.min(gap_durations.len() - 1);
+        let (_, p95, _) = gap_durations.select_nth_unstable_by(index, f64::total_cmp);
+        *p95
     };
 
-    hangs.sort_by(|left, right| right.duration_ms.total_cmp(&left.duration_ms));
-    stutters.sort_by(|left, right| right.duration_ms.total_cmp(&left.duration_ms));
-
     Ok(AnalysisReport {
         trace_file: trace_path.to_string(),
         hang_threshold_ms,
@@ -566,56 +565,149 @@ fn analyze_trace(
         avg_duration_ms: round2(avg_duration),
         p95_duration_ms: round2(p95_duration),
         passed: hangs.is_empty(),
-        top_hangs: hangs.into_iter().take(10).collect(),
-        top_stutters: stutters.into_iter().take(10).collect(),
+        top_hangs: longest_events(hangs, TOP_EVENT_COUNT),
+        top_stutters: longest_events(stutters, TOP_EVENT_COUNT),
     })
 }
 
+/// Returns the `limit` longest events, longest first, without sorting the
+/// whole list. Events of equal duration keep their trace order, as a stable
+/// sort would, so reports are reproducible.
+fn longest_events(events: Vec<HangEvent>, limit: usize) -> Vec<HangEvent> {
+    let mut ranked = events.into_iter().enumerate().collect::<Vec<_>>();
+    let longest_first = |(left_index, left): &(usize, HangEvent),
+                         (right_index, right): &(usize, HangEvent)| {
+        right
+            .duration_ms
+            .total_cmp(&left.duration_ms)
+            .then(left_index.cmp(right_index))
+    };
+    if ranked.len() > limit {
+        ranked.select_nth_unstable_by(limit, longest_first);
+        ranked.truncate(limit);
+    }
+    ranked.sort_unstable_by(longest_first);
+    ranked.into_iter().map(|(_, event)| event).collect()
+}
+
+/// Instruments tables exported for analysis, with the file name used when an
+/// export has to go through a temporary file.
+const EXPORTED_TABLES: &[(&str, &str)] = &[
+    ("potential-hangs", "potential_hangs.xml"),
+    ("time-profile", "time_profile.xml"),
+];
+
+/// XML for one exported Instruments table.
+struct TableExport {
+    schema: &'static str,
+    xml: String,
+}
+
 fn export_trace_data(
     trace_path: &Utf8Path,
-    output_dir: &Path,
     quiet: bool,
     reporter: &Reporter,
-) -> Result<Vec<Utf8PathBuf>> {
+) -> Result<Vec<TableExport>> {
+    // Each export is a separate xctrace launch over the same trace, so run
+    // them side by side instead of paying the startup cost serially.
+    let results = thread::scope(|scope| {
+        let handles = EXPORTED_TABLES
+            .iter()
+            .map(|&(schema, file_name)| {
+                scope.spawn(move || export_table(trace_path, schema, file_name, reporter))
+            })
+            .collect::<Vec<_>>();
+        handles
+            .into_iter()
+            .map(|handle| handle.join().expect("xctrace export thread panicked"))
+            .collect::<Vec<_>>()
+    });
+
     let mut exported = Vec::new();
-    let hangs_path = Utf8PathBuf::from_path_buf(output_dir.join("potential_hangs.xml"))
-        .map_err(|p| anyhow!("non-UTF-8 export path: {p:?}"))?;
-    let time_profile_path = Utf8PathBuf::from_path_buf(output_dir.join("time_profile.xml"))
-        .map_err(|p| anyhow!("non-UTF-8 export path: {p:?}"))?;
-
-    for (path, xpath) in [
-        (
-            hangs_path,
-            r#"/trace-toc/run[@number="1"]/data/table[@schema="potential-hangs"]"#,
-        ),
-        (
-            time_profile_path,
-            r#"/trace-toc/run[@number="1"]/data/table[@schema="time-profile"]"#,
-        ),
-    ] {
-        let output = Runner::new(reporter, "xcrun")
+    for (&(schema, _), xml) in EXPORTED_TABLES.iter().zip(results) {
+        let Some(xml) = xml? else {
+            continue;
+        };
+        if xml.len() > 100 {
+            if !quiet {
+                reporter.info(&format!("  Exported {} ({} bytes)", schema, xml.len()));
+            }
+            exported.push(TableExport { schema, xml });
+        }
+    }
+
+    Ok(exported)
+}
+
+/// Exports one table from the first run of `trace_path`, returning its XML
+/// (`None` when xctrace fails).
+///
+/// The export is read straight from xctrace's stdout so the XML never makes
+/// a round trip through disk; a temporary `file_name` is only used if xctrace
+/// succeeds but writes nothing there. A failed export (e.g. a table the trace
+/// doesn't contain) is not retried, since it would only fail again.
+fn export_table(
+    trace_path: &Utf8Path,
+    schema: &str,
+    file_name: &str,
+    reporter: &Reporter,
+) -> Result<Option<String>> {
+    let xpath = format!(r#"/trace-toc/run[@number="1"]/data/table[@schema="{schema}"]"#);
+    let export = |output: &Path| {
+        Runner::new(reporter, "xcrun")
             .args(["xctrace", "export", "--input"])
             .arg(trace_path.as_std_path())
             .arg("--xpath")
-            .arg(xpath)
+            .arg(&xpath)
             .arg("--output")
-            .arg(path.as_std_path())
+            .arg(output)
             .capture_stderr()
-            .output_status()?;
-        if output.status.success() {
-            let file_size = fs::metadata(path.as_std_path())
-                .map(|meta| meta.len())
-                .unwrap_or(0);
-            if file_size > 100 {
-                if !quiet {
-                    reporter.info(&format!("  Exported {} ({} bytes)", path, file_size));
-                }
-                exported.push(path);
-            }
-        }
+            .output_status()
+    };
+
+    let output = export(Path::new("/dev/stdout"))?;
+    if !output.status.success() {
+        return Ok(None);
+    }
+    if !output.stdout.is_empty() {
+        return String::from_utf8(output.stdout)
+            .map(Some)
+            .with_context(|| format!("decoding {schema} export"));
     }
 
-    Ok(exported)
+    let tempdir = TempDir::new().context("creating temporary directory for xctrace export")?;
+    let path = tempdir.path().join(file_name);
+    if !export(&path)?.status.success() {
+        return Ok(None);
+    }
+    fs::read_to_string(&path)
+        .map(Some)
+        .with_context(|| format!("reading {}", path.display()))
+}
+
+/// Running count, sum and max of every positive sample duration, accumulated
+/// while the exports are parsed so the summary needs no extra passes.
+#[derive(Debug, Clone, Copy, Default)]
+struct DurationStats {
+    count: usize,
+    total_ms: f64,
+    max_ms: Option<f64>,
+}
+
+impl DurationStats {
+    fn record(&mut self, duration_ms: f64) {
+        self.count += 1;
+        self.total_ms += duration_ms;
+        self.max_ms = Some(self.max_ms.map_or(duration_ms, |max| max.max(duration_ms)));
+    }
+
+    fn average_ms(&self) -> f64 {
+        if self.count == 0 {
+            0.0
+        } else {
+            self.total_ms / self.count as f64
+        }
+    }
 }
 
 #[derive(Debug, Clone)]
@@ -628,71 +720,77 @@ struct MainThreadGap {
 }
 
 fn parse_time_profile(
-    xml_path: &Utf8Path,
+    export: &TableExport,
     hang_threshold_ms: f64,
     stutter_threshold_ms: f64,
-) -> Result<(Vec<HangEvent>, Vec<HangEvent>, Vec<f64>, Vec<MainThreadGap>)> {
-    let xml = fs::read_to_string(xml_path.as_std_path())
-        .with_context(|| format!("reading {xml_path}"))?;
-    let doc = Document::parse(&xml).with_context(|| format!("parsing {xml_path}"))?;
+    durations: &mut DurationStats,
+) -> Result<(Vec<HangEvent>, Vec<HangEvent>, Vec<MainThreadGap>)> {
+    let doc = Document::parse(&export.xml)
+        .with_context(|| format!("parsing {} export", export.schema))?;
 
+    // Every lookup borrows from the parsed document, so indexing the id/ref
+    // tables does not copy any of the export's text.
     let mut value_lookup = BTreeMap::new();
     let mut thread_lookup = BTreeMap::new();
     let mut frame_lookup = BTreeMap::new();
-    let mut backtrace_lookup: BTreeMap<String, Vec<(Option<String>, Option<String>)>> =
-        BTreeMap::new();
+    let mut backtrace_lookup = BTreeMap::new();
+    // Rows are collected during the same walk and processed once the tables
+    // are complete, instead of traversing the whole document a second time.
+    let mut rows = Vec::new();
 
     for node in doc.descendants().filter(|node| node.is_element()) {
+        if node.tag_name().name() == "row" {
+            rows.push(node);
+        }
         if let Some(id) = node.attribute("id") {
             if let Some(text) = node.text() {
-                value_lookup.insert(id.to_string(), text.to_string());
+                value_lookup.insert(id, text);
             }
             if node.tag_name().name() == "thread" {
                 if let Some(fmt) = node.attribute("fmt") {
-                    thread_lookup.insert(id.to_string(), fmt.to_string());
+                    thread_lookup.insert(id, fmt);
                 }
             }
             if node.tag_name().name() == "frame" {
                 if let Some(name) = node.attribute("name") {
-                    frame_lookup.insert(id.to_string(), name.to_string());
+                    frame_lookup.insert(id, name);
                 }
             }
             if node.tag_name().name() == "backtrace" {
-                let frames = node
-                    .children()
-                    .filter(|child| child.is_element() && child.tag_name().name() == "frame")
-                    .map(|frame| {
-                        (
-                            frame.attribute("name").map(str::to_string),
-                            frame.attribute("ref").map(str::to_string),
-                        )
-                    })
-                    .collect::<Vec<_>>();
-                backtrace_lookup.insert(id.to_string(), frames);
+                backtrace_lookup.insert(id, backtrace_frames(node));
             }
         }
     }
 
     let mut hangs = Vec::new();
     let mut stutters = Vec::new();
-    let mut all_durations = Vec::new();
     let mut main_thread_samples = Vec::new();
 
-    for row in doc
-        .descendants()
-        .filter(|node| node.is_element() && node.tag_name().name() == "row")
-    {
-        let is_main = row
-            .descendants()
-            .find(|node| node.is_element() && node.tag_name().name() == "thread")
-            .is_some_and(|node| is_main_thread(node, &thread_lookup));
-
-        let duration = find_numeric_value(row, "weight", &value_lookup)
-            .or_else(|| find_numeric_value(row, "duration", &value_lookup))
-            .map(|value| value / 1_000_000.0);
-        let timestamp = find_numeric_value(row, "sample-time", &value_lookup)
-            .or_else(|| find_numeric_value(row, "start-time", &value_lookup))
-            .map(|value| value / 1_000_000.0);
+    // Rows below both thresholds only matter for the duration stats and, on
+    // the main thread, the gap analysis; their backtraces are resolved only
+    // when one of those actually needs them.
+    let event_threshold_ms = hang_threshold_ms.min(stutter_threshold_ms);
+
+    for row in rows {
+        let Some(duration_ms) = find_preferred_numeric_value(row, &DURATION_TAGS, &value_lookup)
+            .map(|value| value * MS_PER_NS)
+            .filter(|duration| *duration > 0.0)
+        else {
+            continue;
+        };
+        durations.record(duration_ms);
+
+        let timestamp = find_preferred_numeric_value(row, &TIMESTAMP_TAGS, &value_lookup)
+            .map(|value| value * MS_PER_NS);
+        let main_thread_timestamp = timestamp.filter(|_| {
+            row.descendants()
+                .find(|node| node.is_element() && node.tag_name().name() == "thread")
+                .is_some_and(|node| is_main_thread(node, &thread_lookup))
+        });
+        let is_event = duration_ms >= event_threshold_ms;
+        if !is_event && main_thread_timestamp.is_none() {
+            continue;
+        }
 
         let (mut function, backtrace) = row
             .descendants()
@@ -703,85 +801,123 @@ fn parse_time_profile(
         if let Some(hang_type) = row
             .descendants()
             .find(|node| node.is_element() && node.tag_name().name() == "hang-type")
-            .and_then(|node| {
-                node_value(node, &value_lookup)
-                    .or_else(|| node.attribute("fmt").map(str::to_string))
-            })
+            .and_then(|node| node_value(node, &value_lookup).or_else(|| node.attribute("fmt")))
         {
             function = format!("[{hang_type}] {function}");
         }
 
-        if let Some(duration_ms) = duration.filter(|duration| *duration > 0.0) {
-            all_durations.push(duration_ms);
-            if is_main {
-                if let Some(timestamp_ms) = timestamp {
-                    main_thread_samples.push((timestamp_ms, function.clone(), backtrace.clone()));
-                }
-            }
-            let event = HangEvent {
-                duration_ms,
-                timestamp_ms: timestamp.unwrap_or(0.0),
-                function,
-                backtrace,
-                is_hang: duration_ms >= hang_threshold_ms,
-            };
-            if duration_ms >= hang_threshold_ms {
-                hangs.push(event);
-            } else if duration_ms >= stutter_threshold_ms {
-                stutters.push(event);
-            }
+        if let Some(timestamp_ms) = main_thread_timestamp {
+            main_thread_samples.push((timestamp_ms, function.clone(), backtrace.clone()));
+        }
+        if !is_event {
+            continue;
+        }
+        let event = HangEvent {
+            duration_ms,
+            timestamp_ms: timestamp.unwrap_or(0.0),
+            function,
+            backtrace,
+            is_hang: duration_ms >= hang_threshold_ms,
+        };
+        if event.is_hang {
+            hangs.push(event);
+        } else {
+            stutters.push(event);
         }
     }
 
     main_thread_samples.sort_by(|left, right| left.0.total_cmp(&right.0));
-    let mut gaps = Vec::new();
-    for window in main_thread_samples.windows(2) {
-        let (prev_ts, prev_func, prev_bt) = &window[0];
-        let (curr_ts, curr_func, curr_bt) = &window[1];
-        let gap = curr_ts - prev_ts;
-        if gap > 0.0 {
-            gaps.push(MainThreadGap {
-                duration_ms: gap,
-                timestamp_ms: *curr_ts,
-                function: curr_func.clone(),
-                backtrace: curr_bt.clone(),
-                is_idle: is_gap_idle_period(
-                    prev_func,
-                    prev_bt.as_deref(),
-                    curr_func,
-                    curr_bt.as_deref(),
-                ),
-            });
+    // Each gap takes ownership of the sample that ends it; the sample that
+    // starts it only contributes its timestamp and idle flag, so nothing is
+    // cloned and every backtrace is classified once.
+    let mut gaps = Vec::with_capacity(main_thread_samples.len().saturating_sub(1));
+    let mut samples = main_thread_samples.into_iter();
+    if let Some((first_ts, first_function, first_backtrace)) = samples.next() {
+        let mut prev_ts = first_ts;
+        let mut prev_idle = is_idle_backtrace(&first_function, first_backtrace.as_deref());
+        for (curr_ts, function, backtrace) in samples {
+            let curr_idle = is_idle_backtrace(&function, backtrace.as_deref());
+            let gap = curr_ts - prev_ts;
+            if gap > 0.0 {
+                gaps.push(MainThreadGap {
+                    duration_ms: gap,
+                    timestamp_ms: curr_ts,
+                    is_idle: is_gap_idle_period(
+                        prev_idle,
+                        curr_idle,
+                        &function,
+                        backtrace.as_deref(),
+                    ),
+                    function,
+                    backtrace,
+                });
+            }
+            prev_ts = curr_ts;
+            prev_idle = curr_idle;
         }
     }
 
-    Ok((hangs, stutters, all_durations, gaps))
+    Ok((hangs, stutters, gaps))
 }
 
-fn find_numeric_value(
+/// xctrace exports durations and timestamps in nanoseconds.
+const MS_PER_NS: f64 = 1e-6;
+
+/// Candidate column tags for a row's duration and timestamp, in preference
+/// order.
+const DURATION_TAGS: [&str; 2] = ["weight", "duration"];
+const TIMESTAMP_TAGS: [&str; 2] = ["sample-time", "start-time"];
+
+/// Reads a numeric column out of a row from a list of candidate tags.
+///
+/// Gives the same answer as trying each candidate in turn (the first one
+/// whose first occurrence parses wins), but in a single walk of the row that
+/// stops as soon as no better candidate can follow. Rows list their weight and
+/// timestamp columns ahead of the backtrace, so the usual case never walks
+/// into the backtrace subtree.
+fn find_preferred_numeric_value<const N: usize>(
     row: roxmltree::Node<'_, '_>,
-    tag: &str,
-    value_lookup: &BTreeMap<String, String>,
+    candidates: &[&str; N],
+    value_lookup: &BTreeMap<&str, &str>,
 ) -> Option<f64> {
-    row.descendants()
-        .find(|node| node.is_element() && node.tag_name().name() == tag)
-        .and_then(|node| node_value(node, value_lookup))
-        .and_then(|value| value.parse::<f64>().ok())
+    let mut seen = [false; N];
+    let mut best: Option<(usize, f64)> = None;
+    for node in row.descendants().filter(|node| node.is_element()) {
+        let name = node.tag_name().name();
+        let Some(index) = candidates.iter().position(|&tag| tag == name) else {
+            continue;
+        };
+        if std::mem::replace(&mut seen[index], true)
+            || best.is_some_and(|(best_index, _)| best_index < index)
+        {
+            continue;
+        }
+        if let Some(value) =
+            node_value(node, value_lookup).and_then(|value| value.parse::<f64>().ok())
+        {
+            best = Some((index, value));
+        }
+        let rank = best.map_or(N, |(best_index, _)| best_index);
+        if seen[..rank].iter().all(|&checked| checked) {
+            break;
+        }
+    }
+    best.map(|(_, value)| value)
 }
 
-fn node_value(
-    node: roxmltree::Node<'_, '_>,
-    value_lookup: &BTreeMap<String, String>,
-) -> Option<String> {
-    node.text().map(str::to_string).or_else(|| {
+fn node_value<'a>(
+    node: roxmltree::Node<'a, '_>,
+    value_lookup: &BTreeMap<&str, &'a str>,
+) -> Option<&'a str> {
+    node.text().or_else(|| {
         node.attribute("ref")
-            .and_then(|reference| value_lookup.get(reference).cloned())
+            .and_then(|reference| value_lookup.get(reference).copied())
     })
 }
 
 fn is_main_thread(
     thread_node: roxmltree::Node<'_, '_>,
-    thread_lookup: &BTreeMap<String, String>,
+    thread_lookup: &BTreeMap<&str, &str>,
 ) -> bool {
     if let Some(fmt) = thread_node.attribute("fmt") {
         return fmt.contains("Main Thread");
@@ -792,41 +928,45 @@ fn is_main_thread(
         .is_some_and(|fmt| fmt.contains("Main Thread"))
 }
 
-fn resolve_backtrace(
-    backtrace_node: roxmltree::Node<'_, '_>,
-    backtrace_lookup: &BTreeMap<String, Vec<(Option<String>, Option<String>)>>,
-    frame_lookup: &BTreeMap<String, String>,
+type BacktraceFrame<'a> = (Option<&'a str>, Option<&'a str>);
+
+fn backtrace_frames<'a>(backtrace_node: roxmltree::Node<'a, '_>) -> Vec<BacktraceFrame<'a>> {
+    backtrace_node
+        .children()
+        .filter(|child| child.is_element() && child.tag_name().name() == "frame")
+        .map(|frame| (frame.attribute("name"), frame.attribute("ref")))
+        .collect()
+}
+
+fn resolve_backtrace<'a>(
+    backtrace_node: roxmltree::Node<'a, '_>,
+    backtrace_lookup: &BTreeMap<&str, Vec<BacktraceFrame<'a>>>,
+    frame_lookup: &BTreeMap<&str, &'a str>,
 ) -> (String, Option<String>) {
-    let frames = if let Some(reference) = backtrace_node.attribute("ref") {
-        backtrace_lookup.get(reference).cloned().unwrap_or_default()
-    } else {
-        backtrace_node
-            .children()
-            .filter(|child| child.is_element() && child.tag_name().name() == "frame")
-            .map(|frame| {
-                (
-                    frame.attribute("name").map(str::to_string),
-                    frame.attribute("ref").map(str::to_string),
-                )
-            })
-            .collect::<Vec<_>>()
+    let inline_frames;
+    let frames = match backtrace_node.attribute("ref") {
+        Some(reference) => backtrace_lookup
+            .get(reference)
+            .map(Vec::as_slice)
+            .unwrap_or_default(),
+        None => {
+            inline_frames = backtrace_frames(backtrace_node);
+            inline_frames.as_slice()
+        }
     };
 
     let resolved = frames
-        .into_iter()
-        .map(|(name, reference)| {
-            name.or_else(|| reference.and_then(|reference| frame_lookup.get(&reference).cloned()))
-                .unwrap_or_else(|| "?".to_string())
+        .iter()
+        .take(10)
+        .map(|&(name, reference)| {
+            name.or_else(|| reference.and_then(|reference| frame_lookup.get(reference).copied()))
+                .unwrap_or("?")
         })
         .collect::<Vec<_>>();
 
-    if resolved.is_empty() {
-        ("unknown".to_string(), None)
-    } else {
-        (
-            resolved[0].clone(),
-            Some(resolved.into_iter().take(10).collect::<Vec<_>>().join("\n")),
-        )
+    match resolved.first() {
+        None => ("unknown".to_string(), None),
+        Some(function) => (function.to_string(), Some(resolved.join("\n"))),
     }
 }
 
@@ -857,13 +997,11 @@ fn is_idle_backtrace(function: &str, backtrace: Option<&str>) -> bool {
 }
 
 fn is_gap_idle_period(
-    before_function: &str,
-    before_backtrace: Option<&str>,
+    before_idle: bool,
+    after_idle: bool,
     after_function: &str,
     after_backtrace: Option<&str>,
 ) -> bool {
-    let before_idle = is_idle_backtrace(before_function, before_backtrace);
-    let after_idle = is_idle_backtrace(after_function, after_backtrace);
     if before_idle && after_idle {
         return true;
     }
@@ -893,67 +1031,170 @@ fn is_gap_idle_period(
 }
 
 fn print_report(report: &AnalysisReport, reporter: &Reporter) {
-    reporter.info("");
-    reporter.info("============================================================");
-    reporter.info("PERFORMANCE TRACE ANALYSIS");
-    reporter.info("============================================================");
-    reporter.info(&format!("Trace file: {}", report.trace_file));
-    reporter.info(&format!("Hang threshold: {}ms", report.hang_threshold_ms));
-    reporter.info(&format!(
-        "Stutter threshold: {}ms",
-        report.stutter_threshold_ms
-    ));
-    reporter.info("");
-    reporter.info("--- Summary ---");
-    reporter.info(&format!("Total samples analyzed: {}", report.total_samples));
-    reporter.info(&format!("Average duration: {}ms", report.avg_duration_ms));
-    reporter.info(&format!("Max duration: {}ms", report.max_duration_ms));
-    reporter.info(&format!("P95 duration: {}ms", report.p95_duration_ms));
-    reporter.info("");
-    reporter.info(&format!(
-        "--- Hangs (>= {}ms) ---",
-        report.hang_threshold_ms
-    ));
-    reporter.info(&format!("Count: {}", report.hang_count));
-    reporter.info(&format!(
-        "Total duration: {}ms",
-        report.total_hang_duration_ms
-    ));
+    const RULE: &str = "============================================================";
+
+    // Assemble the whole report and hand it to the reporter in one write
+    // rather than taking the stdout lock once per line.
+    let mut out = String::new();
+    writeln!(out).unwrap();
+    writeln!(out, "{RULE}").unwrap();
+    writeln!(out, "PERFORMANCE TRACE ANALYSIS").unwrap();
+    writeln!(out, "{RULE}").unwrap();
+    writeln!(out, "Trace file: {}", report.trace_file).unwrap();
+    writeln!(out, "Hang threshold: {}ms", report.hang_threshold_ms).unwrap();
+    writeln!(out, "Stutter threshold: {}ms", report.stutter_threshold_ms).unwrap();
+    writeln!(out).unwrap();
+    writeln!(out, "--- Summary ---").unwrap();
+    writeln!(out, "Total samples analyzed: {}", report.total_samples).unwrap();
+    writeln!(out, "Average duration: {}ms", report.avg_duration_ms).unwrap();
+    writeln!(out, "Max duration: {}ms", report.max_duration_ms).unwrap();
+    writeln!(out, "P95 duration: {}ms", report.p95_duration_ms).unwrap();
+    writeln!(out).unwrap();
+    writeln!(out, "--- Hangs (>= {}ms) ---", report.hang_threshold_ms).unwrap();
+    writeln!(out, "Count: {}", report.hang_count).unwrap();
+    writeln!(out, "Total duration: {}ms", report.total_hang_duration_ms).unwrap();
     if !report.top_hangs.is_empty() {
-        reporter.info("");
-        reporter.info("Top hangs:");
+        writeln!(out).unwrap();
+        writeln!(out, "Top hangs:").unwrap();
         for (index, hang) in report.top_hangs.iter().take(5).enumerate() {
-            reporter.info(&format!(
+            writeln!(
+                out,
                 "  {}. {:.1}ms - {}",
                 index + 1,
                 hang.duration_ms,
                 hang.function
-            ));
+            )
+            .unwrap();
         }
     }
-    reporter.info("");
-    reporter.info(&format!(
+    writeln!(out).unwrap();
+    writeln!(
+        out,
         "--- Stutters ({}-{}ms) ---",
         report.stutter_threshold_ms, report.hang_threshold_ms
-    ));
-    reporter.info(&format!("Count: {}", report.stutter_count));
-    reporter.info(&format!(
+    )
+    .unwrap();
+    writeln!(out, "Count: {}", report.stutter_count).unwrap();
+    writeln!(
+        out,
         "Total duration: {}ms",
         report.total_stutter_duration_ms
-    ));
-    reporter.info("");
-    reporter.info("============================================================");
+    )
+    .unwrap();
+    writeln!(out).unwrap();
+    writeln!(out, "{RULE}").unwrap();
     if report.passed {
-        reporter.info("PASS: No main thread hangs detected");
+        writeln!(out, "PASS: No main thread hangs detected").unwrap();
     } else {
-        reporter.info(&format!(
+        writeln!(
+            out,
             "FAIL: Detected {} main thread hang(s)",
             report.hang_count
-        ));
+        )
+        .unwrap();
     }
-    reporter.info("============================================================");
+    write!(out, "{RULE}").unwrap();
+    reporter.info(&out);
 }
 
 fn round2(value: f64) -> f64 {
     (value * 100.0).round() / 100.0
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn numeric_values(xml: &str, candidates: &[&str; 2]) -> Vec<Option<f64>> {
+        let doc = Document::parse(xml).unwrap();
+        let value_lookup = BTreeMap::new();
+        doc.descendants()
+            .filter(|node| node.has_tag_name("row"))
+            .map(|row| find_preferred_numeric_value(row, candidates, &value_lookup))
+            .collect()
+    }
+
+    fn event(function: &str, duration_ms: f64) -> HangEvent {
+        HangEvent {
+            duration_ms,
+            timestamp_ms: 0.0,
+            function: function.to_string(),
+            backtrace: None,
+            is_hang: false,
+        }
+    }
+
+    fn functions(events: &[HangEvent]) -> Vec<&str> {
+        events.iter().map(|event| event.function.as_str()).collect()
+    }
+
+    #[test]
+    fn longest_events_keeps_trace_order_for_equal_durations() {
+        let events = vec![
+            event("a", 5.0),
+            event("b", 9.0),
+            event("c", 5.0),
+            event("d", 9.0),
+            event("e", 5.0),
+        ];
+
+        assert_eq!(
+            functions(&longest_events(events, 10)),
+            vec!["b", "d", "a", "c", "e"]
+        );
+    }
+
+    #[test]
+    fn longest_events_truncates_to_limit() {
+        let events = vec![
+            event("a", 1.0),
+            event("b", 7.0),
+            event("c", 3.0),
+            event("d", 7.0),
+            event("e", 3.0),
+        ];
+
+        assert_eq!(
+            functions(&longest_events(events.clone(), 3)),
+            vec!["b", "d", "c"]
+        );
+        assert!(longest_events(events, 0).is_empty());
+        assert!(longest_events(Vec::new(), 3).is_empty());
+    }
+
+    #[test]
+    fn duration_stats_average_is_zero_without_samples() {
+        let mut stats = DurationStats::default();
+        assert_eq!(stats.average_ms(), 0.0);
+
+        stats.record(2.0);
+        stats.record(4.0);
+        assert_eq!(stats.average_ms(), 3.0);
+        assert_eq!(stats.max_ms, Some(4.0));
+    }
+
+    #[test]
+    fn preferred_numeric_value_prefers_weight_on_every_row() {
+        let xml = r#"<node>
+            <row><duration>5</duration><backtrace/></row>
+            <row><duration>6</duration><backtrace/></row>
+            <row><duration>7</duration><weight>1</weight><backtrace/></row>
+            <row><weight>2</weight><backtrace><duration>9</duration></backtrace></row>
+        </node>"#;
+
+        assert_eq!(
+            numeric_values(xml, &DURATION_TAGS),
+            vec![Some(5.0), Some(6.0), Some(1.0), Some(2.0)]
+        );
+    }
+
+    #[test]
+    fn preferred_numeric_value_uses_first_occurrence_and_falls_back() {
+        let xml = r#"<node>
+            <row><weight>n/a</weight><weight>3</weight><duration>4</duration></row>
+            <row><weight>n/a</weight></row>
+        </node>"#;
+
+        assert_eq!(numeric_values(xml, &DURATION_TAGS), vec![Some(4.0), None]);
+    }
+}
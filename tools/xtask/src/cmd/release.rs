@@ -1222,7 +1222,9 @@ fn import_metadata(
         .map_err(|p| anyhow!("non-UTF-8 tempdir path: {p:?}"))?;
     let import_metadata = import_root.join("metadata");
     let screenshots_dir = import_root.join("screenshots");
-    copy_dir_recursive(&metadata_dir, &import_metadata)?;
+    // `asc` only reads the import tree and the whatsNew retry only unlinks
+    // release notes from it, so hard links stand in for a full copy.
+    link_dir_recursive(&metadata_dir, &import_metadata)?;
     fs::create_dir_all(screenshots_dir.as_std_path())?;
 
     let args = vec![
@@ -1242,11 +1244,11 @@ fn import_metadata(
             Ok(())
         }
         Err(err) => {
-            let release_notes_removed = remove_release_notes(&import_metadata)?;
-            if release_notes_removed
-                && err.to_string().contains("whatsNew")
-                && err.to_string().contains("cannot be edited")
-            {
+            let message = err.to_string();
+            if !(message.contains("whatsNew") && message.contains("cannot be edited")) {
+                return Err(err);
+            }
+            if remove_release_notes(&import_metadata)? {
                 reporter.info(
                     "whatsNew rejected (first submission), retrying without release notes...",
                 );
@@ -2112,11 +2114,15 @@ fn remove_release_notes(dir: &Utf8Path) -> Result<bool> {
     }
     for entry in fs::read_dir(dir.as_std_path()).with_context(|| format!("reading {dir}"))? {
         let entry = entry?;
-        let path = Utf8PathBuf::from_path_buf(entry.path())
-            .map_err(|p| anyhow!("non-UTF-8 path: {p:?}"))?;
-        if path.as_std_path().is_dir() {
+        // The dirent already carries the type; no extra stat per entry, and
+        // symlinks are never followed into trees outside `dir`.
+        let file_type = entry.file_type()?;
+        if file_type.is_dir() {
+            let path = Utf8PathBuf::from_path_buf(entry.path())
+                .map_err(|p| anyhow!("non-UTF-8 path: {p:?}"))?;
             removed |= remove_release_notes(&path)?;
-        } else if path.file_name() == Some("release_notes.txt") {
+        } else if entry.file_name() == "release_notes.txt" {
+            let path = dir.join("release_notes.txt");
             fs::remove_file(path.as_std_path()).with_context(|| format!("removing {path}"))?;
             removed = true;
         }
@@ -2223,6 +2229,36 @@ fn tool_exists(reporter: &Reporter, name: &str) -> Result<bool> {
 }
 
 fn copy_dir_recursive(src: &Utf8Path, dst: &Utf8Path) -> Result<()> {
+    mirror_dir_recursive(src, dst, copy_file)
+}
+
+/// Mirror `src` into `dst` with hard links instead of byte copies. Only for
+/// trees that are read but never edited in place: a linked file shares its
+/// contents with the source, so unlinking it is safe but rewriting it is not.
+fn link_dir_recursive(src: &Utf8Path, dst: &Utf8Path) -> Result<()> {
+    mirror_dir_recursive(src, dst, link_or_copy_file)
+}
+
+fn copy_file(src: &Utf8Path, dst: &Utf8Path) -> Result<()> {
+    fs::copy(src.as_std_path(), dst.as_std_path())
+        .with_context(|| format!("copying {src} to {dst}"))?;
+    Ok(())
+}
+
+/// Hard-link `src` to `dst`, copying instead when the two paths live on
+/// different volumes (or the filesystem has no hard links).
+fn link_or_copy_file(src: &Utf8Path, dst: &Utf8Path) -> Result<()> {
+    if fs::hard_link(src.as_std_path(), dst.as_std_path()).is_ok() {
+        return Ok(());
+    }
+    copy_file(src, dst)
+}
+
+fn mirror_dir_recursive(
+    src: &Utf8Path,
+    dst: &Utf8Path,
+    place_file: fn(&Utf8Path, &Utf8Path) -> Result<()>,
+) -> Result<()> {
     if !src.as_std_path().is_dir() {
         return Err(anyhow!("source directory not found: {src}"));
     }
@@ -2243,10 +2279,9 @@ fn copy_dir_recursive(src: &Utf8Path, dst: &Utf8Path) -> Result<()> {
             std::os::unix::fs::symlink(&link_target, target.as_std_path())
                 .with_context(|| format!("recreating symlink {target}"))?;
         } else if file_type.is_dir() {
-            copy_dir_recursive(&path, &target)?;
+            mirror_dir_recursive(&path, &target, place_file)?;
         } else {
-            fs::copy(path.as_std_path(), target.as_std_path())
-                .with_context(|| format!("copying {path} to {target}"))?;
+            place_file(&path, &target)?;
         }
     }
     Ok(())